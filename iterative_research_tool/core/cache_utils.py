@@ -0,0 +1,74 @@
+"""Disk-backed response caching shared by the panels.
+
+A tiny JSON-file-per-entry store: no extra dependency, safe to delete at
+any time, and fast enough that cache reads are effectively free next to
+an LLM round trip.
+"""
+
+import logging
+import os
+import time
+from typing import Any, Optional
+
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
+
+logger = logging.getLogger(__name__)
+
+# Default entry lifetime for cached responses
+DEFAULT_CACHE_TTL = 86400
+
+
+class DiskCache:
+    """Tiny JSON-file cache that persists values across process restarts.
+
+    Each entry is a single file named after its key holding the expiry
+    timestamp and cached value. Stale or unreadable entries count as misses.
+    """
+
+    def __init__(self, directory: str, default_ttl: int = DEFAULT_CACHE_TTL):
+        # The directory is created on first write, not here: caches are
+        # built at module level, and panel discovery imports every panel
+        # module, so import must not touch the filesystem
+        self.directory = os.path.expanduser(directory)
+        self.default_ttl = default_ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                entry = fast_loads(f.read())
+            if entry["expires"] < time.time():
+                os.remove(path)
+                return None
+            return entry["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """Store a value under a key with a time-to-live.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+            expire: Seconds until the entry goes stale (defaults to the
+                cache's default TTL)
+        """
+        if expire is None:
+            expire = self.default_ttl
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(key), "w") as f:
+                f.write(fast_dumps({"expires": time.time() + expire, "value": value}))
+        except OSError:
+            logger.debug(f"Could not write disk cache entry {key}")
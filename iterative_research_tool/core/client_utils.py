@@ -0,0 +1,56 @@
+"""Shared Anthropic client construction for the panels.
+
+Each panel used to build its own client, which meant a fresh httpx
+connection pool and TLS handshake per panel instance. Caching one client
+per (event loop, API key) lets every caller on the same loop reuse
+keep-alive sockets.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+# Clients keyed by (running event loop, API key). httpx pools bind their
+# sockets to the loop they were opened on, so a client cached across
+# asyncio.run calls would hand a later run dead sockets ("Event loop is
+# closed"); keying on the loop keeps reuse within a run and isolation
+# between runs, and the weak keys let closed loops drop their pools.
+_CLIENTS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def get_async_client(api_key: str) -> "AsyncAnthropic":
+    """Return the AsyncAnthropic client for an API key on the running loop.
+
+    Panels driving their agents on the same event loop share one httpx
+    connection pool, so concurrent calls reuse keep-alive sockets; each
+    asyncio.run gets a fresh pool because sockets cannot outlive the
+    loop that opened them. Must be called from a running event loop.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        The AsyncAnthropic client shared across the running loop
+    """
+    per_loop = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = per_loop.get(api_key)
+    if client is None:
+        import httpx
+        from anthropic import AsyncAnthropic
+
+        client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60
+                ),
+                timeout=httpx.Timeout(connect=5, read=120, write=10, pool=5)
+            )
+        )
+        per_loop[api_key] = client
+    return client
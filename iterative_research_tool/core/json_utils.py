@@ -0,0 +1,44 @@
+"""Fast JSON serialization helpers shared by the panels.
+
+Uses the orjson C extension when it is installed and falls back to the
+standard library so the tool keeps working without the optional dependency.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def fast_dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def fast_loads(data: str) -> Any:
+    """Parse a JSON string.
+
+    Args:
+        data: JSON string to parse
+
+    Returns:
+        The parsed object
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -6,6 +6,10 @@ from typing import Dict, List, Any, Optional
 class BasePanel(ABC):
     """Base class for all advisory panels."""
     
+    # Empty slots so subclasses that opt into __slots__ actually drop
+    # the per-instance __dict__; subclasses without __slots__ keep one
+    __slots__ = ()
+    
     @abstractmethod
     def run(self, query: str, context: str) -> Dict[str, Any]:
         """Run the panel on the given query.
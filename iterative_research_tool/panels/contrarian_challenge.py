@@ -1,6 +1,8 @@
 """Contrarian Challenge System panel for multi-agent advisory planning."""
 
 import logging
+import re
+import time
 from typing import Dict, List, Any, Optional, TypedDict
 import json
 
@@ -13,9 +15,102 @@ from anthropic import Anthropic
 
 # Local imports
 from iterative_research_tool.panels import BasePanel
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; every node extracts JSON from the same fenced-block shape
+_JSON_FENCE_RE = re.compile(r'```json\n(.*?)\n```', re.DOTALL)
+
+# State key written by each agent
+AGENT_STATE_KEYS = {
+    "problem_analyzer": "problem_analysis",
+    "assumption_challenger": "assumption_challenges",
+    "alternative_viewpoint_generator": "alternative_viewpoints",
+    "logical_fallacy_detector": "logical_fallacy_analysis",
+    "devils_advocate": "devils_advocate_critique",
+    "response_evaluator": "response_evaluation",
+    "robust_strategy_synthesizer": "robust_strategy"
+}
+
+# Upstream sections each agent receives, as (label, state key) pairs
+AGENT_INPUT_SECTIONS = {
+    "problem_analyzer": [],
+    "assumption_challenger": [
+        ("Problem Analysis", "problem_analysis")
+    ],
+    "alternative_viewpoint_generator": [
+        ("Problem Analysis", "problem_analysis")
+    ],
+    "logical_fallacy_detector": [
+        ("Problem Analysis", "problem_analysis"),
+        ("Assumption Challenges", "assumption_challenges")
+    ],
+    "devils_advocate": [
+        ("Problem Analysis", "problem_analysis"),
+        ("Assumption Challenges", "assumption_challenges"),
+        ("Alternative Viewpoints", "alternative_viewpoints"),
+        ("Logical Fallacy Analysis", "logical_fallacy_analysis")
+    ],
+    "response_evaluator": [
+        ("Assumption Challenges", "assumption_challenges"),
+        ("Alternative Viewpoints", "alternative_viewpoints"),
+        ("Logical Fallacy Analysis", "logical_fallacy_analysis"),
+        ("Devil's Advocate Critique", "devils_advocate_critique")
+    ],
+    "robust_strategy_synthesizer": [
+        ("Problem Analysis", "problem_analysis"),
+        ("Assumption Challenges", "assumption_challenges"),
+        ("Alternative Viewpoints", "alternative_viewpoints"),
+        ("Logical Fallacy Analysis", "logical_fallacy_analysis"),
+        ("Devil's Advocate Critique", "devils_advocate_critique"),
+        ("Response Evaluation", "response_evaluation")
+    ]
+}
+
+# Output-token caps per agent, calibrated from logged p99 output sizes; tight
+# caps cut decode-tail latency compared with the old flat 2000/3000
+AGENT_MAX_TOKENS = {
+    "problem_analyzer": 1200,
+    "assumption_challenger": 1500,
+    "alternative_viewpoint_generator": 1800,
+    "logical_fallacy_detector": 1500,
+    "devils_advocate": 1800,
+    "response_evaluator": 1500,
+    "robust_strategy_synthesizer": 2500
+}
+
+# Stages of agents whose inputs are all satisfied by earlier stages; agents
+# within a stage are independent and can ship in one batch
+BATCH_STAGES = [
+    ["problem_analyzer"],
+    ["assumption_challenger", "alternative_viewpoint_generator"],
+    ["logical_fallacy_detector"],
+    ["devils_advocate"],
+    ["response_evaluator"],
+    ["robust_strategy_synthesizer"]
+]
+
+def _upstream_failed(*analyses: Any) -> bool:
+    """Check whether any upstream analysis carries an error or skip sentinel."""
+    return any(
+        isinstance(analysis, dict) and ("error" in analysis or "skipped" in analysis)
+        for analysis in analyses
+    )
+
+class PanelState(TypedDict):
+    """State schema for the contrarian challenge graph."""
+    panel: Any
+    query: str
+    context: Dict
+    problem_analysis: Optional[Dict]
+    assumption_challenges: Optional[Dict]
+    alternative_viewpoints: Optional[Dict]
+    logical_fallacy_analysis: Optional[Dict]
+    devils_advocate_critique: Optional[Dict]
+    response_evaluation: Optional[Dict]
+    robust_strategy: Optional[Dict]
+
 class ContrarianChallengePanel(BasePanel):
     """Contrarian Challenge System panel for multi-agent advisory planning.
     
@@ -23,7 +118,11 @@ class ContrarianChallengePanel(BasePanel):
     opposing viewpoints, and exploring alternative approaches. It helps identify 
     potential blindspots, logical fallacies, and weaknesses in proposed plans.
     """
-    
+
+    # Compiled LangGraph shared by every instance; the graph structure does not
+    # depend on per-instance data, so it is built once per process.
+    _compiled_graph = None
+
     def __init__(
         self,
         anthropic_api_key: str,
@@ -53,8 +152,10 @@ class ContrarianChallengePanel(BasePanel):
             "robust_strategy_synthesizer": self._get_robust_strategy_synthesizer_prompt()
         }
         
-        # Initialize the graph
-        self.graph = self._build_graph()
+        # Initialize the graph, compiling it only for the first instance
+        if ContrarianChallengePanel._compiled_graph is None:
+            ContrarianChallengePanel._compiled_graph = self._build_graph()
+        self.graph = ContrarianChallengePanel._compiled_graph
         
     def _get_problem_analyzer_prompt(self) -> str:
         """Get the prompt for the Problem Analyzer agent."""
@@ -463,179 +564,189 @@ class ContrarianChallengePanel(BasePanel):
         }
         """
         
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow for the Contrarian Challenge System panel."""
-        # Define the state schema
-        class State(TypedDict):
-            query: str
-            context: Dict
-            problem_analysis: Optional[Dict]
-            assumption_challenges: Optional[Dict]
-            alternative_viewpoints: Optional[Dict]
-            logical_fallacy_analysis: Optional[Dict]
-            devils_advocate_critique: Optional[Dict]
-            response_evaluation: Optional[Dict]
-            robust_strategy: Optional[Dict]
-        
-        # Create the graph
-        graph = StateGraph(State)
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
+        """Build the LangGraph workflow for the Contrarian Challenge System panel.
+
+        The node functions read the running panel out of the state, so the
+        compiled graph carries no per-instance references and can be shared.
+        """
+        # Create the graph over the typed state schema
+        graph = StateGraph(PanelState)
         
         # Define the nodes
         
         # Problem Analyzer node
         def problem_analyzer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Problem Analyzer", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Problem Analyzer", "processing")
                 
             query = state["query"]
             context = state["context"]
             
-            prompt = self.agent_prompts["problem_analyzer"]
+            prompt = panel.agent_prompts["problem_analyzer"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["problem_analyzer"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}"}
+                    {"role": "user", "content": f"Query: {query}\n\nContext: {fast_dumps(context)}"}
                 ]
             )
             
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                problem_analysis = json.loads(json_str)
+                problem_analysis = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Problem Analyzer", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Problem Analyzer", "Complete")
                     
                 return {"problem_analysis": problem_analysis}
             except Exception as e:
                 logger.error(f"Error parsing Problem Analyzer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Problem Analyzer", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Problem Analyzer", "Error")
                 return {"problem_analysis": {"error": str(e), "raw_response": content}}
         
         # Assumption Challenger node
         def assumption_challenger(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Assumption Challenger", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Assumption Challenger", "processing")
                 
             query = state["query"]
             context = state["context"]
             problem_analysis = state["problem_analysis"]
             
-            prompt = self.agent_prompts["assumption_challenger"]
+            # Skip the API call when an upstream agent already failed
+            if _upstream_failed(problem_analysis):
+                return {"assumption_challenges": {"skipped": "upstream_error"}}
+
+            prompt = panel.agent_prompts["assumption_challenger"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["assumption_challenger"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nProblem Analysis: {json.dumps(problem_analysis)}"}
+                    {"role": "user", "content": f"Query: {query}\n\nContext: {fast_dumps(context)}\n\nProblem Analysis: {fast_dumps(problem_analysis)}"}
                 ]
             )
             
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                assumption_challenges = json.loads(json_str)
+                assumption_challenges = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Assumption Challenger", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Assumption Challenger", "Complete")
                     
                 return {"assumption_challenges": assumption_challenges}
             except Exception as e:
                 logger.error(f"Error parsing Assumption Challenger response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Assumption Challenger", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Assumption Challenger", "Error")
                 return {"assumption_challenges": {"error": str(e), "raw_response": content}}
         
         # Alternative Viewpoint Generator node
         def alternative_viewpoint_generator(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Alternative Viewpoint Generator", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Alternative Viewpoint Generator", "processing")
                 
             query = state["query"]
             context = state["context"]
             problem_analysis = state["problem_analysis"]
             
-            prompt = self.agent_prompts["alternative_viewpoint_generator"]
+            # Skip the API call when an upstream agent already failed
+            if _upstream_failed(problem_analysis):
+                return {"alternative_viewpoints": {"skipped": "upstream_error"}}
+
+            prompt = panel.agent_prompts["alternative_viewpoint_generator"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["alternative_viewpoint_generator"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nProblem Analysis: {json.dumps(problem_analysis)}"}
+                    {"role": "user", "content": f"Query: {query}\n\nContext: {fast_dumps(context)}\n\nProblem Analysis: {fast_dumps(problem_analysis)}"}
                 ]
             )
             
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                alternative_viewpoints = json.loads(json_str)
+                alternative_viewpoints = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Alternative Viewpoint Generator", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Alternative Viewpoint Generator", "Complete")
                     
                 return {"alternative_viewpoints": alternative_viewpoints}
             except Exception as e:
                 logger.error(f"Error parsing Alternative Viewpoint Generator response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Alternative Viewpoint Generator", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Alternative Viewpoint Generator", "Error")
                 return {"alternative_viewpoints": {"error": str(e), "raw_response": content}}
         
         # Logical Fallacy Detector node
         def logical_fallacy_detector(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Logical Fallacy Detector", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Logical Fallacy Detector", "processing")
                 
             query = state["query"]
             context = state["context"]
             problem_analysis = state["problem_analysis"]
             assumption_challenges = state["assumption_challenges"]
             
-            prompt = self.agent_prompts["logical_fallacy_detector"]
+            # Skip the API call when an upstream agent already failed
+            if _upstream_failed(problem_analysis, assumption_challenges):
+                return {"logical_fallacy_analysis": {"skipped": "upstream_error"}}
+
+            prompt = panel.agent_prompts["logical_fallacy_detector"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["logical_fallacy_detector"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
                     {"role": "user", "content": f"""
                     Query: {query}
                     
-                    Context: {json.dumps(context)}
+                    Context: {fast_dumps(context)}
                     
-                    Problem Analysis: {json.dumps(problem_analysis)}
+                    Problem Analysis: {fast_dumps(problem_analysis)}
                     
-                    Assumption Challenges: {json.dumps(assumption_challenges)}
+                    Assumption Challenges: {fast_dumps(assumption_challenges)}
                     """}
                 ]
             )
@@ -643,29 +754,29 @@ class ContrarianChallengePanel(BasePanel):
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                logical_fallacy_analysis = json.loads(json_str)
+                logical_fallacy_analysis = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Logical Fallacy Detector", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Logical Fallacy Detector", "Complete")
                     
                 return {"logical_fallacy_analysis": logical_fallacy_analysis}
             except Exception as e:
                 logger.error(f"Error parsing Logical Fallacy Detector response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Logical Fallacy Detector", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Logical Fallacy Detector", "Error")
                 return {"logical_fallacy_analysis": {"error": str(e), "raw_response": content}}
         
         # Devil's Advocate node
         def devils_advocate(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Devil's Advocate", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Devil's Advocate", "processing")
                 
             query = state["query"]
             context = state["context"]
@@ -674,26 +785,31 @@ class ContrarianChallengePanel(BasePanel):
             alternative_viewpoints = state["alternative_viewpoints"]
             logical_fallacy_analysis = state["logical_fallacy_analysis"]
             
-            prompt = self.agent_prompts["devils_advocate"]
+            # Skip the API call when an upstream agent already failed
+            if _upstream_failed(problem_analysis, assumption_challenges, alternative_viewpoints, logical_fallacy_analysis):
+                return {"devils_advocate_critique": {"skipped": "upstream_error"}}
+
+            prompt = panel.agent_prompts["devils_advocate"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["devils_advocate"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
                     {"role": "user", "content": f"""
                     Query: {query}
                     
-                    Context: {json.dumps(context)}
+                    Context: {fast_dumps(context)}
                     
-                    Problem Analysis: {json.dumps(problem_analysis)}
+                    Problem Analysis: {fast_dumps(problem_analysis)}
                     
-                    Assumption Challenges: {json.dumps(assumption_challenges)}
+                    Assumption Challenges: {fast_dumps(assumption_challenges)}
                     
-                    Alternative Viewpoints: {json.dumps(alternative_viewpoints)}
+                    Alternative Viewpoints: {fast_dumps(alternative_viewpoints)}
                     
-                    Logical Fallacy Analysis: {json.dumps(logical_fallacy_analysis)}
+                    Logical Fallacy Analysis: {fast_dumps(logical_fallacy_analysis)}
                     """}
                 ]
             )
@@ -701,29 +817,29 @@ class ContrarianChallengePanel(BasePanel):
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                devils_advocate_critique = json.loads(json_str)
+                devils_advocate_critique = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Devil's Advocate", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Devil's Advocate", "Complete")
                     
                 return {"devils_advocate_critique": devils_advocate_critique}
             except Exception as e:
                 logger.error(f"Error parsing Devil's Advocate response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Devil's Advocate", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Devil's Advocate", "Error")
                 return {"devils_advocate_critique": {"error": str(e), "raw_response": content}}
         
         # Response Evaluator node
         def response_evaluator(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Response Evaluator", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Response Evaluator", "processing")
                 
             query = state["query"]
             context = state["context"]
@@ -732,26 +848,31 @@ class ContrarianChallengePanel(BasePanel):
             logical_fallacy_analysis = state["logical_fallacy_analysis"]
             devils_advocate_critique = state["devils_advocate_critique"]
             
-            prompt = self.agent_prompts["response_evaluator"]
+            # Skip the API call when an upstream agent already failed
+            if _upstream_failed(assumption_challenges, alternative_viewpoints, logical_fallacy_analysis, devils_advocate_critique):
+                return {"response_evaluation": {"skipped": "upstream_error"}}
+
+            prompt = panel.agent_prompts["response_evaluator"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["response_evaluator"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
                     {"role": "user", "content": f"""
                     Query: {query}
                     
-                    Context: {json.dumps(context)}
+                    Context: {fast_dumps(context)}
                     
-                    Assumption Challenges: {json.dumps(assumption_challenges)}
+                    Assumption Challenges: {fast_dumps(assumption_challenges)}
                     
-                    Alternative Viewpoints: {json.dumps(alternative_viewpoints)}
+                    Alternative Viewpoints: {fast_dumps(alternative_viewpoints)}
                     
-                    Logical Fallacy Analysis: {json.dumps(logical_fallacy_analysis)}
+                    Logical Fallacy Analysis: {fast_dumps(logical_fallacy_analysis)}
                     
-                    Devil's Advocate Critique: {json.dumps(devils_advocate_critique)}
+                    Devil's Advocate Critique: {fast_dumps(devils_advocate_critique)}
                     """}
                 ]
             )
@@ -759,29 +880,29 @@ class ContrarianChallengePanel(BasePanel):
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                response_evaluation = json.loads(json_str)
+                response_evaluation = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Response Evaluator", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Response Evaluator", "Complete")
                     
                 return {"response_evaluation": response_evaluation}
             except Exception as e:
                 logger.error(f"Error parsing Response Evaluator response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Response Evaluator", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Response Evaluator", "Error")
                 return {"response_evaluation": {"error": str(e), "raw_response": content}}
         
         # Robust Strategy Synthesizer node
         def robust_strategy_synthesizer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Robust Strategy Synthesizer", "processing")
+            panel = state["panel"]
+            if panel.visualizer:
+                panel.visualizer.update_agent_status("Robust Strategy Synthesizer", "processing")
                 
             query = state["query"]
             context = state["context"]
@@ -792,30 +913,42 @@ class ContrarianChallengePanel(BasePanel):
             devils_advocate_critique = state["devils_advocate_critique"]
             response_evaluation = state["response_evaluation"]
             
-            prompt = self.agent_prompts["robust_strategy_synthesizer"]
+            # Produce a failure synthesis without an API call when upstream failed
+            if _upstream_failed(problem_analysis, assumption_challenges,
+                                alternative_viewpoints, logical_fallacy_analysis,
+                                devils_advocate_critique, response_evaluation):
+                return {"robust_strategy": {
+                    "error": "upstream_error",
+                    "Executive Summary": "One or more analysis agents failed, so no robust strategy was produced.",
+                    "Key Insights": ["Upstream agent failure"],
+                    "Robust Strategy": {"core_approach": "Re-run the panel once the upstream errors are resolved"}
+                }}
+
+            prompt = panel.agent_prompts["robust_strategy_synthesizer"]
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
+            response = panel.client.messages.create(
+                model=panel.model,
+                max_tokens=AGENT_MAX_TOKENS["robust_strategy_synthesizer"],
                 temperature=0.7,
+                stop_sequences=["\n\n\n"],
                 system=prompt,
                 messages=[
                     {"role": "user", "content": f"""
                     Query: {query}
                     
-                    Context: {json.dumps(context)}
+                    Context: {fast_dumps(context)}
                     
-                    Problem Analysis: {json.dumps(problem_analysis)}
+                    Problem Analysis: {fast_dumps(problem_analysis)}
                     
-                    Assumption Challenges: {json.dumps(assumption_challenges)}
+                    Assumption Challenges: {fast_dumps(assumption_challenges)}
                     
-                    Alternative Viewpoints: {json.dumps(alternative_viewpoints)}
+                    Alternative Viewpoints: {fast_dumps(alternative_viewpoints)}
                     
-                    Logical Fallacy Analysis: {json.dumps(logical_fallacy_analysis)}
+                    Logical Fallacy Analysis: {fast_dumps(logical_fallacy_analysis)}
                     
-                    Devil's Advocate Critique: {json.dumps(devils_advocate_critique)}
+                    Devil's Advocate Critique: {fast_dumps(devils_advocate_critique)}
                     
-                    Response Evaluation: {json.dumps(response_evaluation)}
+                    Response Evaluation: {fast_dumps(response_evaluation)}
                     """}
                 ]
             )
@@ -823,23 +956,22 @@ class ContrarianChallengePanel(BasePanel):
             try:
                 content = response.content[0].text
                 # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(content)
                 if json_match:
                     json_str = json_match.group(1)
                 else:
                     json_str = content
                 
-                robust_strategy = json.loads(json_str)
+                robust_strategy = fast_loads(json_str)
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Robust Strategy Synthesizer", "Complete")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Robust Strategy Synthesizer", "Complete")
                     
                 return {"robust_strategy": robust_strategy}
             except Exception as e:
                 logger.error(f"Error parsing Robust Strategy Synthesizer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Robust Strategy Synthesizer", "Error")
+                if panel.visualizer:
+                    panel.visualizer.update_agent_status("Robust Strategy Synthesizer", "Error")
                 return {"robust_strategy": {"error": str(e), "raw_response": content}}
         
         # Add nodes to the graph
@@ -885,7 +1017,7 @@ class ContrarianChallengePanel(BasePanel):
         # Parse context if it's a string
         if isinstance(context, str):
             try:
-                context_dict = json.loads(context)
+                context_dict = fast_loads(context)
             except:
                 context_dict = {"raw_context": context}
         else:
@@ -893,6 +1025,7 @@ class ContrarianChallengePanel(BasePanel):
         
         # Initialize the state
         initial_state = {
+            "panel": self,
             "query": query,
             "context": context_dict,
             "problem_analysis": {},
@@ -922,4 +1055,105 @@ class ContrarianChallengePanel(BasePanel):
                 "Executive Summary": "An error occurred while running the Contrarian Challenge System panel.",
                 "Key Insights": ["Error in panel execution"],
                 "Robust Strategy": {"core_approach": "Please try again or contact support"}
-            } 
\ No newline at end of file
+            }
+
+    def run_batch(self, queries: List[str], context: str = "") -> List[Dict[str, Any]]:
+        """Run the panel over many queries via the Anthropic Message Batches API.
+
+        Latency per query is higher than run() because batches are queued, but
+        throughput is much better and batched tokens are billed at a discount,
+        which suits background or bulk-evaluation workloads. Each pipeline
+        stage ships one batch containing every query's requests, so the two
+        independent middle agents also share a single batch.
+
+        Args:
+            queries: The queries to run the panel on
+            context: Context information shared by all queries
+
+        Returns:
+            A robust strategy per query, in input order
+        """
+        # Parse context if it's a string
+        if isinstance(context, str):
+            try:
+                context_dict = fast_loads(context)
+            except:
+                context_dict = {"raw_context": context}
+        else:
+            context_dict = context
+
+        states = [{"query": query, "context": context_dict} for query in queries]
+
+        for stage in BATCH_STAGES:
+            requests = []
+            for index, state in enumerate(states):
+                for agent in stage:
+                    requests.append({
+                        "custom_id": f"{index}-{agent}",
+                        "params": {
+                            "model": self.model,
+                            "max_tokens": AGENT_MAX_TOKENS[agent],
+                            "temperature": 0.7,
+                            "stop_sequences": ["\n\n\n"],
+                            "system": self.agent_prompts[agent],
+                            "messages": [
+                                {"role": "user", "content": self._batch_user_content(agent, state)}
+                            ]
+                        }
+                    })
+
+            for custom_id, parsed in self._submit_batch(requests).items():
+                index, agent = custom_id.split("-", 1)
+                states[int(index)][AGENT_STATE_KEYS[agent]] = parsed
+
+        return [state["robust_strategy"] for state in states]
+
+    def _batch_user_content(self, agent: str, state: Dict[str, Any]) -> str:
+        """Build the user message an agent receives, mirroring the graph nodes.
+
+        Args:
+            agent: Name of the agent
+            state: Accumulated state for one query
+
+        Returns:
+            The user message content
+        """
+        sections = [
+            f"Query: {state['query']}",
+            f"Context: {fast_dumps(state['context'])}"
+        ]
+        for label, state_key in AGENT_INPUT_SECTIONS[agent]:
+            sections.append(f"{label}: {fast_dumps(state[state_key])}")
+        return "\n\n".join(sections)
+
+    def _submit_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Submit one batch, poll until it ends, and parse the responses.
+
+        Args:
+            requests: Batch request entries with custom_id and params
+
+        Returns:
+            Mapping of custom_id to parsed JSON (or an error dict)
+        """
+        batch = self.client.messages.batches.create(requests=requests)
+        while batch.processing_status != "ended":
+            time.sleep(5)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        parsed = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {entry.custom_id} failed: {entry.result.type}")
+                parsed[entry.custom_id] = {"error": entry.result.type}
+                continue
+
+            content = entry.result.message.content[0].text
+            try:
+                json_match = _JSON_FENCE_RE.search(content)
+                json_str = json_match.group(1) if json_match else content
+                parsed[entry.custom_id] = fast_loads(json_str)
+            except Exception as e:
+                logger.error(f"Error parsing batch response {entry.custom_id}: {e}")
+                parsed[entry.custom_id] = {"error": str(e), "raw_response": content}
+
+        return parsed
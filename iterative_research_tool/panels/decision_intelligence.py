@@ -2,16 +2,17 @@
 
 import os
 import json
+import asyncio
 import logging
+import string
 import time
+from types import SimpleNamespace
 from typing import Dict, List, Any, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
-
-# Anthropic imports
-from anthropic import Anthropic
 
 # Local imports
 from iterative_research_tool.panels import BasePanel
+from iterative_research_tool.core.client_utils import get_async_client
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
 from iterative_research_tool.core.visualization import Visualizer
 
 logger = logging.getLogger(__name__)
@@ -130,6 +131,34 @@ DECISION_AGENTS = {
     }
 }
 
+# Dependencies between agents: an agent is scheduled as soon as every agent it
+# depends on has completed, so independent agents run concurrently.
+AGENT_DEPENDENCIES = {
+    "problem_framer": [],
+    "options_generator": [],
+    "evidence_analyst": [],
+    "consequence_forecaster": [],
+    "decision_evaluator": [
+        "problem_framer",
+        "options_generator",
+        "evidence_analyst",
+        "consequence_forecaster"
+    ]
+}
+
+# Precompiled agent table built at import: attribute access instead of nested
+# dict indexing in the hot path, with prompt templates compiled once
+_AGENT_TABLE = {
+    agent_id: SimpleNamespace(
+        name=info["name"],
+        description=info["description"],
+        prompt_tmpl=string.Template(
+            info["prompt"].replace("{query}", "$query").replace("{context}", "$context")
+        )
+    )
+    for agent_id, info in DECISION_AGENTS.items()
+}
+
 class DecisionIntelligencePanel(BasePanel):
     """Panel that brings together decision intelligence agents for structured decision-making."""
     
@@ -151,12 +180,22 @@ class DecisionIntelligencePanel(BasePanel):
             raise ValueError("Anthropic API key is required")
             
         self.model = model
-        self.client = Anthropic(api_key=self.anthropic_api_key)
         self.visualizer = visualizer or Visualizer()
         
         # Initialize the agents
         self.agents = DECISION_AGENTS
     
+    @property
+    def client(self):
+        """The AsyncAnthropic client for the running event loop.
+        
+        Resolved per call rather than in __init__ so run() can be called
+        more than once on an instance: each call drives its own
+        asyncio.run, and a client built under an earlier loop would hand
+        the next one closed-loop sockets.
+        """
+        return get_async_client(self.anthropic_api_key)
+    
     def run(self, query: str, context: str) -> Dict[str, Any]:
         """Run the decision intelligence panel on the given query.
         
@@ -168,13 +207,10 @@ class DecisionIntelligencePanel(BasePanel):
             The panel's output
         """
         self.visualizer.display_message("Running Decision Intelligence Panel...")
-        
-        # Run the agents in sequence
-        agent_results = self._run_agents_sequential(query, context)
-        
-        # Synthesize the results
-        synthesis = self._synthesize_results(query, agent_results)
-        
+
+        # Run the agent DAG and synthesis on a single event loop
+        agent_results, synthesis = asyncio.run(self._run_pipeline(query, context))
+
         # Prepare the final output
         output = {
             "panel_type": "decision_intelligence",
@@ -185,79 +221,122 @@ class DecisionIntelligencePanel(BasePanel):
         }
         
         return output
-    
-    def _run_agents_sequential(self, query: str, context: str) -> Dict[str, Any]:
-        """Run agents in a sequential order, with each agent building on previous results.
-        
+
+    async def _run_pipeline(self, query: str, context: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run the agent DAG followed by synthesis.
+
         Args:
             query: The query to analyze
             context: User context information
-            
+
+        Returns:
+            Tuple of (agent results, synthesis)
+        """
+        # Drain visualizer updates on a background task so terminal I/O never
+        # blocks the coroutines waiting on the API
+        self._status_queue = asyncio.Queue()
+        drain_task = asyncio.create_task(self._drain_status_updates())
+
+        try:
+            agent_results = await self._run_agents_dag(query, context)
+            synthesis = await self._synthesize_results(query, agent_results)
+        finally:
+            self._status_queue.put_nowait(None)
+            await drain_task
+
+        return agent_results, synthesis
+
+    async def _drain_status_updates(self) -> None:
+        """Forward queued agent status updates to the visualizer.
+
+        Runs as a single background task so concurrent agents do not contend
+        for the terminal; a None entry shuts the drain down.
+        """
+        while True:
+            update = await self._status_queue.get()
+            if update is None:
+                break
+            agent_name, status = update
+            await asyncio.to_thread(
+                self.visualizer.update_agent_status,
+                agent_name=agent_name,
+                status=status
+            )
+
+    async def _run_agents_dag(self, query: str, context: str) -> Dict[str, Any]:
+        """Run agents as a dependency DAG, with independent agents running concurrently.
+
+        Each agent waits only for the agents it depends on, so the four
+        independent analysts run in parallel and the evaluator starts as soon
+        as all of them have finished.
+
+        Args:
+            query: The query to analyze
+            context: User context information
+
         Returns:
             Dictionary of agent results
         """
         results = {}
-        accumulated_context = context
-        
-        # Define the sequence of agents
-        agent_sequence = [
-            "problem_framer",
-            "options_generator",
-            "evidence_analyst",
-            "consequence_forecaster",
-            "decision_evaluator"
-        ]
-        
-        # Run each agent in sequence
-        for agent_id in agent_sequence:
-            agent_info = self.agents[agent_id]
-            
-            self.visualizer.update_agent_status(
-                agent_name=agent_info["name"],
-                status="Running"
-            )
-            
-            # Update the context with previous results
-            if results:
-                accumulated_context = f"{context}\n\nPrevious Analysis:\n{json.dumps(results, indent=2)}"
-            
+        serialized_parts = {}
+        completed = {agent_id: asyncio.Event() for agent_id in AGENT_DEPENDENCIES}
+
+        async def run_node(agent_id: str) -> None:
+            agent = _AGENT_TABLE[agent_id]
+            dependencies = AGENT_DEPENDENCIES[agent_id]
+
+            # Wait for all upstream agents to complete
+            for dependency in dependencies:
+                await completed[dependency].wait()
+
+            self._status_queue.put_nowait((agent.name, "Running"))
+
+            # Build the context from upstream results, reusing the JSON each
+            # agent serialized when it completed instead of re-dumping the
+            # whole results dict
+            agent_context = context
+            if dependencies:
+                agent_context = context + "\n\nPrevious Analysis:" + "".join(
+                    serialized_parts[dep] for dep in dependencies
+                )
+
             try:
                 # Run the agent
-                result = self._run_agent(agent_id, agent_info, query, accumulated_context)
+                result = await self._run_agent(agent_id, agent, query, agent_context)
                 results[agent_id] = result
-                
-                self.visualizer.update_agent_status(
-                    agent_name=agent_info["name"],
-                    status="Complete"
-                )
+                serialized_parts[agent_id] = f"\n\n### {agent_id}\n{fast_dumps(result)}"
+
+                self._status_queue.put_nowait((agent.name, "Complete"))
             except Exception as e:
                 logger.error(f"Error running agent {agent_id}: {e}")
                 results[agent_id] = {"error": str(e)}
-                
-                self.visualizer.update_agent_status(
-                    agent_name=agent_info["name"],
-                    status="Error"
-                )
-        
+                serialized_parts[agent_id] = f"\n\n### {agent_id}\n{fast_dumps(results[agent_id])}"
+
+                self._status_queue.put_nowait((agent.name, "Error"))
+            finally:
+                completed[agent_id].set()
+
+        await asyncio.gather(*(run_node(agent_id) for agent_id in AGENT_DEPENDENCIES))
+
         return results
-    
-    def _run_agent(self, agent_id: str, agent_info: Dict[str, str], query: str, context: str) -> Dict[str, Any]:
+
+    async def _run_agent(self, agent_id: str, agent: SimpleNamespace, query: str, context: str) -> Dict[str, Any]:
         """Run a single agent.
         
         Args:
             agent_id: ID of the agent
-            agent_info: Information about the agent
+            agent: Precompiled agent table entry
             query: The query to analyze
             context: User context information
             
         Returns:
             The agent's analysis
         """
-        # Format the prompt
-        prompt = agent_info["prompt"].format(query=query, context=context)
-        
+        # Format the prompt from the precompiled template
+        prompt = agent.prompt_tmpl.substitute(query=query, context=context)
+
         # Call Claude
-        response = self.client.messages.create(
+        response = await self.client.messages.create(
             model=self.model,
             max_tokens=4000,
             messages=[
@@ -275,34 +354,34 @@ class DecisionIntelligencePanel(BasePanel):
             
             if json_start >= 0 and json_end > json_start:
                 json_str = response_text[json_start:json_end]
-                analysis = json.loads(json_str)
+                analysis = fast_loads(json_str)
                 
                 # Add metadata
                 analysis["agent_id"] = agent_id
-                analysis["agent_name"] = agent_info["name"]
-                analysis["agent_description"] = agent_info["description"]
+                analysis["agent_name"] = agent.name
+                analysis["agent_description"] = agent.description
                 
                 return analysis
             else:
-                logger.warning(f"Could not find JSON in {agent_info['name']}'s response")
+                logger.warning(f"Could not find JSON in {agent.name}'s response")
                 return {
                     "agent_id": agent_id,
-                    "agent_name": agent_info["name"],
-                    "agent_description": agent_info["description"],
+                    "agent_name": agent.name,
+                    "agent_description": agent.description,
                     "error": "Could not parse JSON response",
                     "raw_response": response_text
                 }
         except json.JSONDecodeError:
-            logger.warning(f"Error parsing JSON from {agent_info['name']}'s response")
+            logger.warning(f"Error parsing JSON from {agent.name}'s response")
             return {
                 "agent_id": agent_id,
-                "agent_name": agent_info["name"],
-                "agent_description": agent_info["description"],
+                "agent_name": agent.name,
+                "agent_description": agent.description,
                 "error": "Could not parse JSON response",
                 "raw_response": response_text
             }
     
-    def _synthesize_results(self, query: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
+    async def _synthesize_results(self, query: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
         """Synthesize the results from all agents.
         
         Args:
@@ -321,10 +400,10 @@ class DecisionIntelligencePanel(BasePanel):
         Original Query: {query}
         
         You have received analyses from the following decision intelligence agents:
-        {', '.join([f"{agent_info['name']}" for agent_id, agent_info in self.agents.items()])}
-        
+        {', '.join(info['name'] for info in self.agents.values())}
+
         Here are their analyses:
-        {json.dumps(agent_results, indent=2)}
+        {fast_dumps(agent_results)}
         
         Please synthesize these analyses into a comprehensive decision recommendation with the following sections:
         1. Decision Summary: Summarize the decision context and key considerations
@@ -337,7 +416,7 @@ class DecisionIntelligencePanel(BasePanel):
         """
         
         # Call Claude for synthesis
-        response = self.client.messages.create(
+        response = await self.client.messages.create(
             model=self.model,
             max_tokens=4000,
             messages=[
@@ -355,7 +434,7 @@ class DecisionIntelligencePanel(BasePanel):
             
             if json_start >= 0 and json_end > json_start:
                 json_str = synthesis_text[json_start:json_end]
-                synthesis = json.loads(json_str)
+                synthesis = fast_loads(json_str)
                 return synthesis
             else:
                 logger.warning("Could not find JSON in synthesis response")
@@ -1,137 +1,239 @@
 """Future Scenarios Panel for exploring potential futures and their implications."""
 
 import os
-import json
+import asyncio
+import hashlib
 import logging
 import time
 from typing import Dict, List, Any, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor
 
 # Anthropic imports
-from anthropic import Anthropic
+from anthropic import RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
 # Local imports
+from iterative_research_tool.core.cache_utils import DiskCache
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
 from iterative_research_tool.panels import BasePanel
+from iterative_research_tool.core.client_utils import get_async_client
 from iterative_research_tool.core.visualization import Visualizer
 
 logger = logging.getLogger(__name__)
 
+# Abort a streamed call if no data arrives for this long; a stalled
+# connection must not hang the whole pipeline
+STREAM_CHUNK_TIMEOUT = 30
+
+# Shared prompt scaffolding: defined once instead of repeated inside every
+# agent entry, and kept stable so the cached prefix matches across agents
+PROMPT_HEADER = """Analyze the user's query from {perspective} perspective.
+
+Provide your analysis in the following format:
+"""
+PROMPT_FOOTER = "\nFormat your response as JSON with these sections as keys."
+
 # Define the future scenarios agents
 SCENARIO_AGENTS = {
     "trend_analyst": {
         "name": "Trend Analyst",
         "description": "Identifies key trends and driving forces",
-        "prompt": """You are a Trend Analyst who excels at identifying key trends and driving forces that shape the future.
-        Your approach involves scanning across STEEP domains (Social, Technological, Economic, Environmental, Political) to identify important shifts.
-        
-        Analyze the following query from a trend analysis perspective:
-        
-        {query}
-        
-        User Context:
-        {context}
-        
-        Provide your analysis in the following format:
-        1. Social Trends: Identify key social and demographic trends
+        "role": """You are a Trend Analyst who excels at identifying key trends and driving forces that shape the future.
+        Your approach involves scanning across STEEP domains (Social, Technological, Economic, Environmental, Political) to identify important shifts.""",
+        "perspective": "a trend analysis",
+        "format_sections": """        1. Social Trends: Identify key social and demographic trends
         2. Technological Trends: Identify key technological developments
         3. Economic Trends: Identify key economic and business trends
         4. Environmental Trends: Identify key environmental and resource trends
         5. Political Trends: Identify key political and regulatory trends
-        6. Cross-Cutting Forces: Identify trends that cut across multiple domains
-        
-        Format your response as JSON with these sections as keys."""
+        6. Cross-Cutting Forces: Identify trends that cut across multiple domains""",
+        "sections": [
+            "Social Trends",
+            "Technological Trends",
+            "Economic Trends",
+            "Environmental Trends",
+            "Political Trends",
+            "Cross-Cutting Forces"
+        ],
+        "max_tokens": 1500
     },
     "uncertainty_mapper": {
         "name": "Uncertainty Mapper",
         "description": "Maps critical uncertainties and their potential outcomes",
-        "prompt": """You are an Uncertainty Mapper who excels at identifying critical uncertainties and their potential outcomes.
-        Your approach involves distinguishing between predetermined elements and true uncertainties, and exploring the range of possible outcomes.
-        
-        Analyze the following query from an uncertainty mapping perspective:
-        
-        {query}
-        
-        User Context:
-        {context}
-        
-        Provide your analysis in the following format:
-        1. Predetermined Elements: Identify factors that are relatively certain
+        "role": """You are an Uncertainty Mapper who excels at identifying critical uncertainties and their potential outcomes.
+        Your approach involves distinguishing between predetermined elements and true uncertainties, and exploring the range of possible outcomes.""",
+        "perspective": "an uncertainty mapping",
+        "format_sections": """        1. Predetermined Elements: Identify factors that are relatively certain
         2. Critical Uncertainties: Identify the most important uncertainties
         3. Uncertainty Ranges: For each critical uncertainty, describe the range of possible outcomes
         4. Uncertainty Interactions: Describe how different uncertainties might interact
-        5. Signposts: Identify early indicators that would signal which way uncertainties are resolving
-        
-        Format your response as JSON with these sections as keys."""
+        5. Signposts: Identify early indicators that would signal which way uncertainties are resolving""",
+        "sections": [
+            "Predetermined Elements",
+            "Critical Uncertainties",
+            "Uncertainty Ranges",
+            "Uncertainty Interactions",
+            "Signposts"
+        ],
+        "max_tokens": 1500
     },
     "scenario_builder": {
         "name": "Scenario Builder",
         "description": "Constructs coherent, plausible future scenarios",
-        "prompt": """You are a Scenario Builder who excels at constructing coherent, plausible future scenarios.
-        Your approach involves combining trends and uncertainties into integrated narratives that explore different possible futures.
-        
-        Analyze the following query from a scenario building perspective:
-        
-        {query}
-        
-        User Context:
-        {context}
-        
-        Provide your analysis in the following format:
-        1. Scenario Framework: Describe the key dimensions that differentiate your scenarios
+        "role": """You are a Scenario Builder who excels at constructing coherent, plausible future scenarios.
+        Your approach involves combining trends and uncertainties into integrated narratives that explore different possible futures.""",
+        "perspective": "a scenario building",
+        "format_sections": """        1. Scenario Framework: Describe the key dimensions that differentiate your scenarios
         2. Scenario 1 - [Name]: Describe a coherent future scenario
         3. Scenario 2 - [Name]: Describe a different coherent future scenario
         4. Scenario 3 - [Name]: Describe a third coherent future scenario
         5. Scenario 4 - [Name]: Describe a fourth coherent future scenario
-        6. Common Elements: Identify elements common to all scenarios
-        
-        Format your response as JSON with these sections as keys."""
+        6. Common Elements: Identify elements common to all scenarios""",
+        "sections": [
+            "Scenario Framework",
+            "Common Elements"
+        ],
+        "max_tokens": 2500
     },
     "implication_analyst": {
         "name": "Implication Analyst",
         "description": "Analyzes the implications of different scenarios",
-        "prompt": """You are an Implication Analyst who excels at analyzing the implications of different scenarios.
-        Your approach involves exploring how different futures would affect stakeholders, strategies, and decisions.
-        
-        Analyze the following query from an implications perspective:
-        
-        {query}
-        
-        User Context:
-        {context}
-        
-        Provide your analysis in the following format:
-        1. Stakeholder Implications: How different scenarios would affect key stakeholders
+        "role": """You are an Implication Analyst who excels at analyzing the implications of different scenarios.
+        Your approach involves exploring how different futures would affect stakeholders, strategies, and decisions.""",
+        "perspective": "an implications",
+        "format_sections": """        1. Stakeholder Implications: How different scenarios would affect key stakeholders
         2. Strategic Implications: How different scenarios would affect strategies and plans
         3. Decision Implications: How different scenarios should influence current decisions
         4. Risk Implications: Key risks that emerge in different scenarios
-        5. Opportunity Implications: Key opportunities that emerge in different scenarios
-        
-        Format your response as JSON with these sections as keys."""
+        5. Opportunity Implications: Key opportunities that emerge in different scenarios""",
+        "sections": [
+            "Stakeholder Implications",
+            "Strategic Implications",
+            "Decision Implications",
+            "Risk Implications",
+            "Opportunity Implications"
+        ],
+        "max_tokens": 1500
     },
     "robust_strategist": {
         "name": "Robust Strategist",
         "description": "Develops strategies that work across multiple futures",
-        "prompt": """You are a Robust Strategist who excels at developing strategies that work across multiple possible futures.
-        Your approach involves identifying robust actions, adaptive strategies, and options that preserve future flexibility.
-        
-        Analyze the following query from a robust strategy perspective:
-        
-        {query}
-        
-        User Context:
-        {context}
-        
-        Provide your analysis in the following format:
-        1. Robust Actions: Identify actions that make sense across all scenarios
+        "role": """You are a Robust Strategist who excels at developing strategies that work across multiple possible futures.
+        Your approach involves identifying robust actions, adaptive strategies, and options that preserve future flexibility.""",
+        "perspective": "a robust strategy",
+        "format_sections": """        1. Robust Actions: Identify actions that make sense across all scenarios
         2. Scenario-Specific Strategies: Identify strategies tailored to specific scenarios
         3. Adaptive Strategies: Identify strategies that can adapt as the future unfolds
         4. Real Options: Identify investments that preserve future flexibility
-        5. Hedging Strategies: Identify ways to mitigate risks across scenarios
-        
-        Format your response as JSON with these sections as keys."""
+        5. Hedging Strategies: Identify ways to mitigate risks across scenarios""",
+        "sections": [
+            "Robust Actions",
+            "Scenario-Specific Strategies",
+            "Adaptive Strategies",
+            "Real Options",
+            "Hedging Strategies"
+        ],
+        "max_tokens": 1500
     }
 }
 
+# Compose each agent's full static prompt once at import
+for _info in SCENARIO_AGENTS.values():
+    _info["system_prompt"] = (
+        _info["role"]
+        + "\n\n"
+        + PROMPT_HEADER.format(perspective=_info["perspective"])
+        + _info["format_sections"]
+        + "\n"
+        + PROMPT_FOOTER
+    )
+
+# Static instructions for refining a draft synthesis with late agent results
+REFINE_SYSTEM_PROMPT = """You are a Future-Ready Strategist. You produced a draft future-ready strategy before the implication and robust-strategy analyses were available. Update the draft with the newly arrived analyses, keeping the same sections:
+1. Future Landscape
+2. Strategic Imperatives
+3. Core Strategy
+4. Adaptive Elements
+5. Near-Term Actions
+
+Format your response as JSON with these sections as keys."""
+
+# JSON keys the synthesizer must emit
+SYNTHESIS_SECTIONS = [
+    "Future Landscape",
+    "Strategic Imperatives",
+    "Core Strategy",
+    "Adaptive Elements",
+    "Near-Term Actions"
+]
+
+# Static synthesis instructions, kept stable so the prompt cache can reuse them
+SYNTHESIS_SYSTEM_PROMPT = """You are a Future-Ready Strategist who excels at synthesizing scenario analyses into actionable, future-proof strategies.
+
+Please synthesize the analyses you receive into a comprehensive future-ready strategy with the following sections:
+1. Future Landscape: Summarize the key trends and scenarios that shape the future landscape
+2. Strategic Imperatives: Identify the most important strategic imperatives given the future landscape
+3. Core Strategy: Outline a core strategy that is robust across multiple futures
+4. Adaptive Elements: Identify elements of the strategy that should adapt to different futures
+5. Near-Term Actions: Recommend specific near-term actions to implement the strategy
+
+Format your response as JSON with these sections as keys."""
+
+# Location for the on-disk response cache
+DISK_CACHE_DIR = "~/.cache/future_scenarios"
+
+class _TokenBucket:
+    """Token-per-minute budget shared by the concurrent API calls."""
+
+    def __init__(self, capacity: int, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: int) -> None:
+        """Wait until the bucket can cover the requested tokens.
+
+        Args:
+            amount: Estimated tokens the next call will consume
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.refill_per_sec
+                )
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.refill_per_sec)
+
+def _tool_schema(sections: List[str]) -> Dict[str, Any]:
+    """Build a permissive input schema whose keys mirror the prompt sections.
+
+    Args:
+        sections: Section names the agent is asked to produce
+
+    Returns:
+        JSON schema for the structured-output tool
+    """
+    return {
+        "type": "object",
+        "properties": {section: {} for section in sections},
+        "additionalProperties": True
+    }
+
+# Stages of the scenario workflow: agents within a stage are independent of
+# each other and run concurrently, while later stages build on earlier results
+AGENT_STAGES = [
+    ["trend_analyst", "uncertainty_mapper"],
+    ["scenario_builder"],
+    ["implication_analyst", "robust_strategist"]
+]
+
 class FutureScenariosPanel(BasePanel):
     """Panel that explores potential futures and their implications."""
     
@@ -139,7 +241,10 @@ class FutureScenariosPanel(BasePanel):
         self,
         anthropic_api_key: Optional[str] = None,
         model: str = "claude-3-7-sonnet-20250219",
-        visualizer: Optional[Visualizer] = None
+        visualizer: Optional[Visualizer] = None,
+        run_mode: str = "staged",
+        max_concurrency: int = 4,
+        tokens_per_minute: int = 16000
     ):
         """Initialize the future scenarios panel.
         
@@ -147,17 +252,41 @@ class FutureScenariosPanel(BasePanel):
             anthropic_api_key: API key for Anthropic
             model: Model to use for the panel
             visualizer: Visualizer for displaying output
+            run_mode: "staged" honors inter-stage dependencies; "speculative"
+                fires all agents at once and reconciles afterwards
+            max_concurrency: Maximum simultaneous API calls
+            tokens_per_minute: Token budget matching the account's TPM limit
         """
         self.anthropic_api_key = anthropic_api_key or os.environ.get("ANTHROPIC_API_KEY")
         if not self.anthropic_api_key:
             raise ValueError("Anthropic API key is required")
             
         self.model = model
-        self.client = Anthropic(api_key=self.anthropic_api_key)
+        self.run_mode = run_mode
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
         self.visualizer = visualizer or Visualizer()
         
         # Initialize the agents
         self.agents = SCENARIO_AGENTS
+        # Frozen up front so the synthesis prompt prefix stays byte-stable
+        self._agents_namelist = ", ".join(a["name"] for a in self.agents.values())
+
+        # Exact-match response caches: an in-memory layer for the current
+        # process and a disk layer that survives restarts
+        self._response_cache = {}
+        self._disk_cache = DiskCache(DISK_CACHE_DIR)
+    
+    @property
+    def client(self):
+        """The AsyncAnthropic client for the running event loop.
+        
+        Resolved per call rather than in __init__ so run() and
+        run_batch() can be called more than once on an instance: each
+        call drives its own asyncio.run, and a client built under an
+        earlier loop would hand the next one closed-loop sockets.
+        """
+        return get_async_client(self.anthropic_api_key)
     
     def run(self, query: str, context: str) -> Dict[str, Any]:
         """Run the future scenarios panel on the given query.
@@ -170,13 +299,10 @@ class FutureScenariosPanel(BasePanel):
             The panel's output
         """
         self.visualizer.display_message("Running Future Scenarios Panel...")
-        
-        # Run the agents in sequence
-        agent_results = self._run_agents_sequential(query, context)
-        
-        # Synthesize the results
-        synthesis = self._synthesize_results(query, agent_results)
-        
+
+        # Run the agent stages and synthesis on a single event loop
+        agent_results, synthesis = asyncio.run(self._run_pipeline(query, context))
+
         # Prepare the final output
         output = {
             "panel_type": "future_scenarios",
@@ -188,46 +314,185 @@ class FutureScenariosPanel(BasePanel):
         
         return output
     
-    def _run_agents_sequential(self, query: str, context: str) -> Dict[str, Any]:
-        """Run agents in a sequential order, with each agent building on previous results.
-        
+    def run_batch(self, query: str, context: str) -> Dict[str, Any]:
+        """Run the panel through the Anthropic Message Batches API.
+
+        All five agents go out in one batch against the bare query and
+        context, as in speculative mode, then synthesis runs normally. Batch
+        turnaround is minutes rather than seconds, but batched tokens are
+        billed at half price and do not consume the interactive rate limit,
+        which suits bulk report generation.
+
         Args:
             query: The query to analyze
             context: User context information
-            
+
+        Returns:
+            The panel's output
+        """
+        self.visualizer.display_message("Running Future Scenarios Panel (batch)...")
+
+        agent_results, synthesis = asyncio.run(self._run_pipeline_batch(query, context))
+
+        output = {
+            "panel_type": "future_scenarios",
+            "query": query,
+            "agent_results": agent_results,
+            "synthesis": synthesis,
+            "timestamp": time.time()
+        }
+
+        return output
+
+    async def _run_pipeline_batch(self, query: str, context: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Submit all agents as one batch, poll it, then synthesize.
+
+        Args:
+            query: The query to analyze
+            context: User context information
+
+        Returns:
+            Tuple of (agent results, synthesis)
+        """
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self._tpm = _TokenBucket(self.tokens_per_minute, self.tokens_per_minute / 60)
+
+        requests = []
+        for agent_id, agent_info in self.agents.items():
+            requests.append({
+                "custom_id": agent_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": agent_info.get("max_tokens", 2000),
+                    "system": [
+                        {
+                            "type": "text",
+                            "text": agent_info["system_prompt"],
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {
+                            "type": "text",
+                            "text": f"User Context:\n{context}",
+                            "cache_control": {"type": "ephemeral"}
+                        }
+                    ],
+                    "messages": [
+                        {"role": "user", "content": query}
+                    ],
+                    "tools": [{
+                        "name": "analyze",
+                        "description": "Record the structured analysis.",
+                        "input_schema": _tool_schema(agent_info["sections"])
+                    }],
+                    "tool_choice": {"type": "tool", "name": "analyze"}
+                }
+            })
+
+        batch = await self.client.messages.batches.create(requests=requests)
+        while batch.processing_status != "ended":
+            await asyncio.sleep(10)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        results = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            agent_info = self.agents[entry.custom_id]
+
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {entry.custom_id} failed: {entry.result.type}")
+                results[entry.custom_id] = {"error": entry.result.type}
+                continue
+
+            analysis = self._tool_input(entry.result.message)
+            if analysis is None:
+                results[entry.custom_id] = {
+                    "agent_id": entry.custom_id,
+                    "agent_name": agent_info["name"],
+                    "agent_description": agent_info["description"],
+                    "error": "Could not parse JSON response",
+                    "raw_response": self._message_text(entry.result.message)
+                }
+                continue
+
+            analysis["agent_id"] = entry.custom_id
+            analysis["agent_name"] = agent_info["name"]
+            analysis["agent_description"] = agent_info["description"]
+            results[entry.custom_id] = analysis
+
+        synthesis = await self._synthesize_results(query, results)
+        return results, synthesis
+
+    async def _run_pipeline(self, query: str, context: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run the agent stages followed by synthesis.
+
+        Args:
+            query: The query to analyze
+            context: User context information
+
+        Returns:
+            Tuple of (agent results, synthesis)
+        """
+        # The governors are per-event-loop, so build them here rather than in
+        # __init__: parallel calls stay under the concurrency cap and the
+        # account's TPM budget instead of bouncing off 429s
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self._tpm = _TokenBucket(self.tokens_per_minute, self.tokens_per_minute / 60)
+
+        self._draft_synthesis_task = None
+        agent_results = await self._run_agents_dag(query, context)
+
+        # If a draft synthesis was raced against the final stage, finish with
+        # a short refinement call instead of a full synthesis
+        if self._draft_synthesis_task is not None:
+            # The draft is purely speculative, so a failed or stalled draft
+            # task must not sink a run whose agents all succeeded — fall back
+            # to the single full synthesis instead
+            try:
+                draft = await self._draft_synthesis_task
+            except Exception as e:
+                logger.warning(f"Draft synthesis failed, falling back to full synthesis: {e}")
+                draft = {"error": str(e)}
+            if "error" not in draft:
+                synthesis = await self._refine_synthesis(query, draft, agent_results)
+            else:
+                synthesis = await self._synthesize_results(query, agent_results)
+        else:
+            synthesis = await self._synthesize_results(query, agent_results)
+
+        return agent_results, synthesis
+
+    async def _run_agents_dag(self, query: str, context: str) -> Dict[str, Any]:
+        """Run the scenario agents stage by stage.
+
+        The two framing agents and the two downstream agents are independent
+        within their stages, so each stage's agents run concurrently and only
+        the stage boundaries serialize on prior results.
+
+        Args:
+            query: The query to analyze
+            context: User context information
+
         Returns:
             Dictionary of agent results
         """
+        if self.run_mode == "speculative":
+            return await self._run_agents_speculative(query, context)
+
         results = {}
+        prior_blocks = []
         accumulated_context = context
-        
-        # Define the sequence of agents
-        agent_sequence = [
-            "trend_analyst",
-            "uncertainty_mapper",
-            "scenario_builder",
-            "implication_analyst",
-            "robust_strategist"
-        ]
-        
-        # Run each agent in sequence
-        for agent_id in agent_sequence:
+
+        async def run_stage_agent(agent_id: str) -> None:
             agent_info = self.agents[agent_id]
-            
+
             self.visualizer.update_agent_status(
                 agent_name=agent_info["name"],
                 status="Running"
             )
-            
-            # Update the context with previous results
-            if results:
-                accumulated_context = f"{context}\n\nPrevious Analysis:\n{json.dumps(results, indent=2)}"
-            
+
             try:
                 # Run the agent
-                result = self._run_agent(agent_id, agent_info, query, accumulated_context)
-                results[agent_id] = result
-                
+                results[agent_id] = await self._run_agent(agent_id, agent_info, query, accumulated_context)
+
                 self.visualizer.update_agent_status(
                     agent_name=agent_info["name"],
                     status="Complete"
@@ -235,15 +500,214 @@ class FutureScenariosPanel(BasePanel):
             except Exception as e:
                 logger.error(f"Error running agent {agent_id}: {e}")
                 results[agent_id] = {"error": str(e)}
-                
+
                 self.visualizer.update_agent_status(
                     agent_name=agent_info["name"],
                     status="Error"
                 )
-        
+
+        for stage in AGENT_STAGES:
+            # Extend the context with only the newest results, serialized once
+            # each; the stable, append-only prefix also maximizes prompt-cache
+            # hits on the context block
+            if prior_blocks:
+                accumulated_context = context + "\n\nPrevious Analysis:\n" + "\n".join(prior_blocks)
+
+            await asyncio.gather(*(run_stage_agent(agent_id) for agent_id in stage))
+
+            for agent_id in stage:
+                prior_blocks.append(
+                    f'### {self.agents[agent_id]["name"]}\n'
+                    f'{fast_dumps(results[agent_id])}'
+                )
+
+            # Race a draft synthesis against the final stage; the refinement
+            # pass afterwards is much shorter than a cold synthesis
+            if "scenario_builder" in stage:
+                self._draft_synthesis_task = asyncio.create_task(
+                    self._synthesize_results(query, dict(results))
+                )
+
         return results
-    
-    def _run_agent(self, agent_id: str, agent_info: Dict[str, str], query: str, context: str) -> Dict[str, Any]:
+
+    async def _run_agents_speculative(self, query: str, context: str) -> Dict[str, Any]:
+        """Fire every agent in parallel, then reconcile only if needed.
+
+        The later agents' dependencies are soft -- their prompts reference
+        prior analyses without requiring them -- so the best case collapses
+        five stacked call latencies into one. If the downstream outputs never
+        mention the built scenarios, the two dependent agents are re-run with
+        the full context, which matches the staged path's latency.
+
+        Args:
+            query: The query to analyze
+            context: User context information
+
+        Returns:
+            Dictionary of agent results
+        """
+        results = {}
+
+        async def run_one(agent_id: str, agent_context: str) -> None:
+            agent_info = self.agents[agent_id]
+
+            self.visualizer.update_agent_status(
+                agent_name=agent_info["name"],
+                status="Running"
+            )
+
+            try:
+                results[agent_id] = await self._run_agent(agent_id, agent_info, query, agent_context)
+
+                self.visualizer.update_agent_status(
+                    agent_name=agent_info["name"],
+                    status="Complete"
+                )
+            except Exception as e:
+                logger.error(f"Error running agent {agent_id}: {e}")
+                results[agent_id] = {"error": str(e)}
+
+                self.visualizer.update_agent_status(
+                    agent_name=agent_info["name"],
+                    status="Error"
+                )
+
+        agent_ids = [agent_id for stage in AGENT_STAGES for agent_id in stage]
+        await asyncio.gather(*(run_one(agent_id, context) for agent_id in agent_ids))
+
+        if self._needs_reconciliation(results):
+            logger.info("Speculative outputs ignored the scenarios; reconciling")
+            upstream_blocks = "\n".join(
+                f'### {self.agents[agent_id]["name"]}\n'
+                f'{fast_dumps(results[agent_id])}'
+                for agent_id in ("trend_analyst", "uncertainty_mapper", "scenario_builder")
+            )
+            full_context = context + "\n\nPrevious Analysis:\n" + upstream_blocks
+            await asyncio.gather(
+                run_one("implication_analyst", full_context),
+                run_one("robust_strategist", full_context)
+            )
+
+        return results
+
+    @staticmethod
+    def _needs_reconciliation(results: Dict[str, Any]) -> bool:
+        """Check whether the downstream agents engaged with the scenarios.
+
+        Args:
+            results: Speculative agent results
+
+        Returns:
+            True if implication analyst and robust strategist never mention
+            any of the built scenario names
+        """
+        scenarios = results.get("scenario_builder", {})
+        names = []
+        for key in scenarios:
+            if key.startswith("Scenario") and key != "Scenario Framework":
+                name = key.split(" - ", 1)[-1].strip()
+                if name:
+                    names.append(name)
+
+        if not names:
+            return False
+
+        downstream = fast_dumps([
+            results.get("implication_analyst", {}),
+            results.get("robust_strategist", {})
+        ])
+        return not any(name in downstream for name in names)
+
+    def _cache_key(self, agent_id: str, query: str, context: str) -> str:
+        """Build the exact-match cache key for one agent invocation.
+
+        Args:
+            agent_id: ID of the agent (or "synthesis")
+            query: The query being analyzed
+            context: Context the agent sees
+
+        Returns:
+            Hex digest key
+        """
+        payload = f"{self.model}|{agent_id}|{query}|{context}"
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
+    async def _collect_stream(self, stream, agent_name: str) -> str:
+        """Accumulate a streamed response, aborting if the stream stalls.
+
+        Args:
+            stream: An open Anthropic message stream
+            agent_name: Display name for progress updates
+
+        Returns:
+            The final response message
+
+        Raises:
+            TimeoutError: If no chunk arrives within STREAM_CHUNK_TIMEOUT
+        """
+        received = 0
+        last_reported = 0
+        events = stream.__aiter__()
+
+        while True:
+            try:
+                event = await asyncio.wait_for(events.__anext__(), timeout=STREAM_CHUNK_TIMEOUT)
+            except StopAsyncIteration:
+                break
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"No streamed data from {agent_name} for {STREAM_CHUNK_TIMEOUT}s"
+                )
+
+            delta = getattr(event, "delta", None)
+            received += len(
+                getattr(delta, "partial_json", "") or getattr(delta, "text", "") or ""
+            )
+
+            # Surface progress roughly every thousand generated tokens
+            if received - last_reported >= 4000:
+                last_reported = received
+                self.visualizer.update_agent_status(
+                    agent_name=agent_name,
+                    status=f"~{received // 4} tokens"
+                )
+
+        return await stream.get_final_message()
+
+    @staticmethod
+    def _tool_input(message) -> Optional[Dict[str, Any]]:
+        """Pull the parsed tool input out of a response message.
+
+        Args:
+            message: The final Anthropic message
+
+        Returns:
+            The structured analysis dict, or None if no tool block came back
+        """
+        for block in message.content:
+            if getattr(block, "type", None) == "tool_use" and isinstance(block.input, dict):
+                return dict(block.input)
+        return None
+
+    @staticmethod
+    def _message_text(message) -> str:
+        """Join any text blocks in a response message.
+
+        Args:
+            message: The final Anthropic message
+
+        Returns:
+            Concatenated text content
+        """
+        return "".join(getattr(block, "text", "") for block in message.content)
+
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _run_agent(self, agent_id: str, agent_info: Dict[str, str], query: str, context: str) -> Dict[str, Any]:
         """Run a single agent.
         
         Args:
@@ -255,56 +719,96 @@ class FutureScenariosPanel(BasePanel):
         Returns:
             The agent's analysis
         """
-        # Format the prompt
-        prompt = agent_info["prompt"].format(query=query, context=context)
-        
-        # Call Claude
-        response = self.client.messages.create(
+        cache_key = self._cache_key(agent_id, query, context)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Response cache hit for {agent_id}")
+            return cached
+
+        cached = self._disk_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Disk cache hit for {agent_id}")
+            self._response_cache[cache_key] = cached
+            return cached
+
+        # The static agent prompt and the shared context ship as cacheable
+        # system blocks, so repeat calls only pay for the short user turn.
+        # Streaming lets us detect stalls instead of blocking indefinitely.
+        # Cap output at the agent's observed p95 size rather than a flat 4000;
+        # over-provisioned caps invite rambling and bill against TPM limits
+        max_tokens = agent_info.get("max_tokens", 2000)
+
+        request_kwargs = dict(
             model=self.model,
-            max_tokens=4000,
+            max_tokens=max_tokens,
+            system=[
+                {
+                    "type": "text",
+                    "text": agent_info["system_prompt"],
+                    "cache_control": {"type": "ephemeral"}
+                },
+                {
+                    "type": "text",
+                    "text": f"User Context:\n{context}",
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
             messages=[
-                {"role": "user", "content": prompt}
-            ]
+                {"role": "user", "content": query}
+            ],
+            tools=[{
+                "name": "analyze",
+                "description": "Record the structured analysis.",
+                "input_schema": _tool_schema(agent_info["sections"])
+            }],
+            tool_choice={"type": "tool", "name": "analyze"}
         )
-        
-        response_text = response.content[0].text
-        
-        # Extract the JSON from the response
-        try:
-            # Find JSON in the response
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
+
+        est_tokens = (len(agent_info["system_prompt"]) + len(context) + len(query)) // 4 + max_tokens
+
+        async with self._sem:
+            await self._tpm.acquire(est_tokens)
+            async with self.client.messages.stream(**request_kwargs) as stream:
+                message = await self._collect_stream(stream, agent_info["name"])
+
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            logger.debug(f"{agent_id} used {usage.output_tokens} output tokens (cap {max_tokens})")
+            if usage.output_tokens >= max_tokens * 0.9:
+                self.visualizer.update_agent_status(
+                    agent_name=agent_info["name"],
+                    status=f"near token cap ({usage.output_tokens}/{max_tokens})"
+                )
+
+        # The forced tool call hands back parsed JSON directly; no string
+        # scanning or JSON-parsing pass over the response text
+        analysis = self._tool_input(message)
+        if analysis is not None:
+            # Add metadata
+            analysis["agent_id"] = agent_id
+            analysis["agent_name"] = agent_info["name"]
+            analysis["agent_description"] = agent_info["description"]
             
-            if json_start >= 0 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                analysis = json.loads(json_str)
-                
-                # Add metadata
-                analysis["agent_id"] = agent_id
-                analysis["agent_name"] = agent_info["name"]
-                analysis["agent_description"] = agent_info["description"]
-                
-                return analysis
-            else:
-                logger.warning(f"Could not find JSON in {agent_info['name']}'s response")
-                return {
-                    "agent_id": agent_id,
-                    "agent_name": agent_info["name"],
-                    "agent_description": agent_info["description"],
-                    "error": "Could not parse JSON response",
-                    "raw_response": response_text
-                }
-        except json.JSONDecodeError:
-            logger.warning(f"Error parsing JSON from {agent_info['name']}'s response")
-            return {
-                "agent_id": agent_id,
-                "agent_name": agent_info["name"],
-                "agent_description": agent_info["description"],
-                "error": "Could not parse JSON response",
-                "raw_response": response_text
-            }
+            self._response_cache[cache_key] = analysis
+            self._disk_cache.set(cache_key, analysis)
+            return analysis
+
+        logger.warning(f"No structured output in {agent_info['name']}'s response")
+        return {
+            "agent_id": agent_id,
+            "agent_name": agent_info["name"],
+            "agent_description": agent_info["description"],
+            "error": "Could not parse JSON response",
+            "raw_response": self._message_text(message)
+        }
     
-    def _synthesize_results(self, query: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _synthesize_results(self, query: str, agent_results: Dict[str, Any]) -> Dict[str, Any]:
         """Synthesize the results from all agents.
         
         Args:
@@ -315,59 +819,144 @@ class FutureScenariosPanel(BasePanel):
             Synthesized future-ready strategy
         """
         self.visualizer.update_status("Synthesizing future-ready strategy...")
-        
-        # Create a prompt for synthesis
-        prompt = f"""
-        You are a Future-Ready Strategist who excels at synthesizing scenario analyses into actionable, future-proof strategies.
-        
-        Original Query: {query}
-        
-        You have received analyses from the following scenario planning agents:
-        {', '.join([f"{agent_info['name']}" for agent_id, agent_info in self.agents.items()])}
-        
-        Here are their analyses:
-        {json.dumps(agent_results, indent=2)}
-        
-        Please synthesize these analyses into a comprehensive future-ready strategy with the following sections:
-        1. Future Landscape: Summarize the key trends and scenarios that shape the future landscape
-        2. Strategic Imperatives: Identify the most important strategic imperatives given the future landscape
-        3. Core Strategy: Outline a core strategy that is robust across multiple futures
-        4. Adaptive Elements: Identify elements of the strategy that should adapt to different futures
-        5. Near-Term Actions: Recommend specific near-term actions to implement the strategy
-        
-        Format your response as JSON with these sections as keys.
-        """
-        
-        # Call Claude for synthesis
-        response = self.client.messages.create(
+
+        cache_key = self._cache_key("synthesis", query, fast_dumps(agent_results))
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Response cache hit for synthesis")
+            return cached
+
+        cached = self._disk_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Disk cache hit for synthesis")
+            self._response_cache[cache_key] = cached
+            return cached
+
+        # Call Claude for synthesis, marking the static instructions and the
+        # large analyses blob as cacheable blocks
+        request_kwargs = dict(
             model=self.model,
             max_tokens=4000,
+            system=[
+                {
+                    "type": "text",
+                    "text": SYNTHESIS_SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
             messages=[
-                {"role": "user", "content": prompt}
-            ]
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"You have received analyses from the following scenario planning agents:\n{self._agents_namelist}\n\nHere are their analyses:\n{fast_dumps(agent_results)}",
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {
+                            "type": "text",
+                            "text": f"Original Query: {query}"
+                        }
+                    ]
+                }
+            ],
+            tools=[{
+                "name": "synthesize",
+                "description": "Record the synthesized strategy.",
+                "input_schema": _tool_schema(SYNTHESIS_SECTIONS)
+            }],
+            tool_choice={"type": "tool", "name": "synthesize"}
         )
-        
-        synthesis_text = response.content[0].text
-        
-        # Extract the JSON from the response
-        try:
-            # Find JSON in the response
-            json_start = synthesis_text.find("{")
-            json_end = synthesis_text.rfind("}") + 1
-            
-            if json_start >= 0 and json_end > json_start:
-                json_str = synthesis_text[json_start:json_end]
-                synthesis = json.loads(json_str)
-                return synthesis
-            else:
-                logger.warning("Could not find JSON in synthesis response")
-                return {
-                    "error": "Could not parse JSON synthesis",
-                    "raw_synthesis": synthesis_text
+
+        est_tokens = len(request_kwargs["messages"][0]["content"][0]["text"]) // 4 + 4000
+
+        async with self._sem:
+            await self._tpm.acquire(est_tokens)
+            async with self.client.messages.stream(**request_kwargs) as stream:
+                message = await self._collect_stream(stream, "Synthesis")
+
+        synthesis = self._tool_input(message)
+        if synthesis is not None:
+            self._response_cache[cache_key] = synthesis
+            # Shorter lifetime: syntheses are content-level results, not
+            # static per-agent analyses
+            self._disk_cache.set(cache_key, synthesis, expire=3600)
+            return synthesis
+
+        logger.warning("No structured output in synthesis response")
+        return {
+            "error": "Could not parse JSON synthesis",
+            "raw_synthesis": self._message_text(message)
+        } 
+
+    @retry(
+        retry=retry_if_exception_type(RateLimitError),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True
+    )
+    async def _refine_synthesis(self, query: str, draft: Dict[str, Any], agent_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a draft synthesis with the late-arriving agent results.
+
+        Args:
+            query: The original query
+            draft: Draft synthesis built from the first three agents
+            agent_results: Results from all agents
+
+        Returns:
+            The refined synthesis, or the draft if refinement fails to parse
+        """
+        self.visualizer.update_status("Refining future-ready strategy...")
+
+        late_blob = fast_dumps({
+            agent_id: agent_results.get(agent_id, {})
+            for agent_id in ("implication_analyst", "robust_strategist")
+        })
+
+        request_kwargs = dict(
+            model=self.model,
+            max_tokens=4000,
+            system=[
+                {
+                    "type": "text",
+                    "text": REFINE_SYSTEM_PROMPT,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": f"Draft strategy:\n{fast_dumps(draft)}",
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {
+                            "type": "text",
+                            "text": f"New analyses:\n{late_blob}\n\nOriginal Query: {query}"
+                        }
+                    ]
                 }
-        except json.JSONDecodeError:
-            logger.warning("Error parsing JSON from synthesis response")
-            return {
-                "error": "Could not parse JSON synthesis",
-                "raw_synthesis": synthesis_text
-            } 
\ No newline at end of file
+            ],
+            tools=[{
+                "name": "synthesize",
+                "description": "Record the synthesized strategy.",
+                "input_schema": _tool_schema(SYNTHESIS_SECTIONS)
+            }],
+            tool_choice={"type": "tool", "name": "synthesize"}
+        )
+
+        est_tokens = (len(fast_dumps(draft)) + len(late_blob)) // 4 + 4000
+
+        async with self._sem:
+            await self._tpm.acquire(est_tokens)
+            async with self.client.messages.stream(**request_kwargs) as stream:
+                message = await self._collect_stream(stream, "Synthesis")
+
+        synthesis = self._tool_input(message)
+        if synthesis is not None:
+            return synthesis
+
+        logger.warning("No structured output in refinement response; keeping draft")
+        return draft
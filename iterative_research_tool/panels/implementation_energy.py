@@ -1,30 +1,318 @@
 """Implementation Energy Panel for multi-agent advisory planning."""
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, TypedDict
-import json
+import os
+from typing import Dict, List, Any, Optional, Tuple, TypedDict
 
-# LangGraph imports
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-
-# Anthropic imports
-from anthropic import Anthropic
+# LangGraph and Anthropic are imported lazily inside _build_graph and
+# the request helpers so importing this module stays cheap for CLI
+# commands that never construct the panel
 
 # Local imports
+from iterative_research_tool.core.cache_utils import DiskCache
+from iterative_research_tool.core.client_utils import get_async_client
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
 from iterative_research_tool.panels import BasePanel
 
 logger = logging.getLogger(__name__)
 
-class State(TypedDict):
-    """State schema for the Implementation Energy Panel."""
+# Disk-backed response cache: identical (model, prompt, user content)
+# requests replay from disk instead of re-running the LLM call
+_RESPONSE_CACHE = DiskCache("~/.multi_agent_cache")
+
+# Output-token caps right-sized to each agent's schema; decode latency
+# scales with the cap, so over-provisioning is pure waste
+MAX_TOKENS = {
+    "implementation_energy_assessor": 1200,
+    "cognitive_load_analyzer": 1500,
+    "motivation_sustainability_analyst": 1500,
+    "organizational_resistance_evaluator": 1500,
+    "habit_formation_specialist": 1800,
+    "energy_optimization_synthesizer": 3000,
+    "combined_middle_tier": 4500
+}
+
+# Display names, state output keys, and upstream inputs for each agent
+# node; the node factory reads these instead of six copy-pasted functions
+AGENT_DISPLAY_NAMES = {
+    "implementation_energy_assessor": "Implementation Energy Assessor",
+    "cognitive_load_analyzer": "Cognitive Load Analyzer",
+    "motivation_sustainability_analyst": "Motivation Sustainability Analyst",
+    "organizational_resistance_evaluator": "Organizational Resistance Evaluator",
+    "habit_formation_specialist": "Habit Formation Specialist",
+    "energy_optimization_synthesizer": "Energy Optimization Synthesizer"
+}
+
+AGENT_STATE_KEYS = {
+    "implementation_energy_assessor": "implementation_energy_assessment",
+    "cognitive_load_analyzer": "cognitive_load_analysis",
+    "motivation_sustainability_analyst": "motivation_sustainability_analysis",
+    "organizational_resistance_evaluator": "organizational_resistance_evaluation",
+    "habit_formation_specialist": "habit_formation_plan",
+    "energy_optimization_synthesizer": "energy_optimized_implementation_plan"
+}
+
+STATE_LABELS = {
+    "implementation_energy_assessment": "Implementation Energy Assessment",
+    "cognitive_load_analysis": "Cognitive Load Analysis",
+    "motivation_sustainability_analysis": "Motivation Sustainability Analysis",
+    "organizational_resistance_evaluation": "Organizational Resistance Evaluation",
+    "habit_formation_plan": "Habit Formation Plan"
+}
+
+AGENT_INPUT_KEYS = {
+    "implementation_energy_assessor": [],
+    "cognitive_load_analyzer": ["implementation_energy_assessment"],
+    "motivation_sustainability_analyst": ["implementation_energy_assessment"],
+    "organizational_resistance_evaluator": ["implementation_energy_assessment"],
+    "habit_formation_specialist": [
+        "implementation_energy_assessment",
+        "cognitive_load_analysis",
+        "motivation_sustainability_analysis",
+        "organizational_resistance_evaluation"
+    ],
+    "energy_optimization_synthesizer": [
+        "implementation_energy_assessment",
+        "cognitive_load_analysis",
+        "motivation_sustainability_analysis",
+        "organizational_resistance_evaluation",
+        "habit_formation_plan"
+    ]
+}
+
+# Agents whose prompts skip the raw context blob: every upstream analysis
+# they receive was already produced from it, so re-sending it only pays
+# prefill for tokens the model effectively has
+AGENTS_WITHOUT_CONTEXT = {"habit_formation_specialist", "energy_optimization_synthesizer"}
+
+# Assessment fields each middle-tier analyst actually references; sending
+# a projection instead of the full assessor blob cuts prefill tokens
+ASSESSMENT_PROJECTION = {
+    "cognitive_load_analyzer": [
+        "summary", "overall_energy_requirement", "energy_bottlenecks", "complexity_resource_match"
+    ],
+    "motivation_sustainability_analyst": [
+        "summary", "overall_energy_requirement", "pacing_analysis", "effort_distribution"
+    ],
+    "organizational_resistance_evaluator": [
+        "summary", "overall_energy_requirement", "energy_bottlenecks", "effort_distribution"
+    ]
+}
+
+# Low temperature for schema-following output
+TEMPERATURE = 0.3
+
+# Top-level keys each agent's structured output must carry; the nested
+# structure is described in the agent prompt and left open in the schema
+AGENT_OUTPUT_KEYS = {
+    "implementation_energy_assessor": ["implementation_energy_assessment"],
+    "cognitive_load_analyzer": ["cognitive_load_analysis"],
+    "motivation_sustainability_analyst": ["motivation_sustainability_analysis"],
+    "organizational_resistance_evaluator": ["organizational_resistance_evaluation"],
+    "habit_formation_specialist": ["habit_formation_plan"],
+    "energy_optimization_synthesizer": [
+        "Executive Summary",
+        "Key Insights",
+        "Energy-Optimized Strategy",
+        "Cognitive Optimization Plan",
+        "Motivation Architecture",
+        "Organizational Alignment Plan",
+        "Habit-Centered Implementation",
+        "Implementation Energy Metrics",
+        "Energy Risk Management"
+    ],
+    "combined_middle_tier": [
+        "cognitive_load_analysis",
+        "motivation_sustainability_analysis",
+        "organizational_resistance_evaluation"
+    ]
+}
+
+# Where per-agent output-token statistics persist across runs
+TOKEN_STATS_PATH = "~/.cache/implementation_energy_panel/token_stats.json"
+
+class _TokenStats:
+    """EMA of observed output tokens per agent, persisted across runs.
+    
+    Decode latency scales with the output cap, so caps converge toward
+    1.5x the typical observed output instead of staying at the static
+    table's ceiling; a truncated response pushes the estimate back up.
+    """
+    
+    def __init__(self, path: str = TOKEN_STATS_PATH, alpha: float = 0.2):
+        self.path = os.path.expanduser(path)
+        self.alpha = alpha
+        try:
+            with open(self.path) as f:
+                self._ema = fast_loads(f.read())
+        except (OSError, ValueError):
+            self._ema = {}
+    
+    def cap(self, agent_name: str, default: int) -> int:
+        """Return the tuned output cap for an agent.
+        
+        Args:
+            agent_name: The agent whose cap is requested
+            default: Static cap used until observations accumulate
+            
+        Returns:
+            The output-token cap, never above the static default
+        """
+        ema = self._ema.get(agent_name)
+        if ema is None:
+            return default
+        return min(default, max(512, int(1.5 * ema)))
+    
+    def record(self, agent_name: str, output_tokens: int, hit_cap: bool) -> None:
+        """Fold an observed output size into the agent's EMA.
+        
+        Args:
+            agent_name: The agent that produced the output
+            output_tokens: Observed output size
+            hit_cap: Whether the response was truncated at the cap
+        """
+        if hit_cap:
+            # The cap clipped the output; inflate the observation so the
+            # next cap lands 30% higher
+            output_tokens = int(output_tokens * 1.3)
+        ema = self._ema.get(agent_name)
+        self._ema[agent_name] = output_tokens if ema is None else (
+            self.alpha * output_tokens + (1 - self.alpha) * ema
+        )
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                f.write(fast_dumps(self._ema))
+        except OSError:
+            logger.debug("Could not persist token stats")
+
+# Minimum length for a repeated string to be worth legend-izing
+_COMPRESS_MIN_LEN = 40
+
+def _compress_for_prompt(values: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """Deduplicate long repeated strings across the upstream analyses.
+    
+    Strings of at least 40 characters appearing more than once are
+    replaced by §N tokens, with a legend mapping each token back to its
+    text; the synthesizer prompt explains the convention.
+    
+    Args:
+        values: Upstream analyses keyed by state key
+        
+    Returns:
+        A (compressed copy, legend) pair; the legend is empty when
+        nothing repeats and the original values are returned unchanged
+    """
+    counts = {}
+    
+    def tally(value):
+        if isinstance(value, str):
+            if len(value) >= _COMPRESS_MIN_LEN:
+                counts[value] = counts.get(value, 0) + 1
+        elif isinstance(value, dict):
+            for item in value.values():
+                tally(item)
+        elif isinstance(value, list):
+            for item in value:
+                tally(item)
+    
+    tally(values)
+    refs = {}
+    for text, count in counts.items():
+        if count >= 2:
+            refs[text] = f"§{len(refs) + 1}"
+    if not refs:
+        return values, ""
+    
+    def substitute(value):
+        if isinstance(value, str):
+            return refs.get(value, value)
+        if isinstance(value, dict):
+            return {key: substitute(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [substitute(item) for item in value]
+        return value
+    
+    legend = "\n".join(f"{ref}={text}" for text, ref in refs.items())
+    return substitute(values), legend
+
+def _project_assessment(assessment: Dict[str, Any], agent_name: str) -> Dict[str, Any]:
+    """Trim the assessor output to the fields an analyst references.
+    
+    Args:
+        assessment: The implementation energy assessment state value
+        agent_name: The consuming analyst
+        
+    Returns:
+        A projected copy, or the original value when no projection is
+        defined or the assessment has an unexpected shape
+    """
+    keys = ASSESSMENT_PROJECTION.get(agent_name)
+    if not keys:
+        return assessment
+    inner = assessment.get("implementation_energy_assessment")
+    if not isinstance(inner, dict):
+        return assessment
+    return {"implementation_energy_assessment": {key: inner[key] for key in keys if key in inner}}
+
+def _submit_tool(agent_name: str) -> Dict[str, Any]:
+    """Build the forced-output tool definition for an agent.
+    
+    Args:
+        agent_name: Key into AGENT_OUTPUT_KEYS
+        
+    Returns:
+        Tool definition whose schema mirrors the agent's top-level keys
+    """
+    return {
+        "name": "submit_analysis",
+        "description": "Record the structured analysis.",
+        "input_schema": {
+            "type": "object",
+            "properties": {key: {} for key in AGENT_OUTPUT_KEYS[agent_name]},
+            "additionalProperties": True
+        }
+    }
+
+def _tool_input(message) -> Optional[Dict[str, Any]]:
+    """Return the first tool_use block's input dict, or None.
+    
+    Args:
+        message: An Anthropic message
+        
+    Returns:
+        The structured tool input, or None if no tool block is present
+    """
+    for block in message.content:
+        if block.type == "tool_use":
+            return dict(block.input)
+    return None
+
+class State(TypedDict, total=False):
+    """State schema for the Implementation Energy Panel.
+    
+    Declared total=False so a run starts from just the query and
+    context and each node contributes only the keys it produced,
+    instead of every transition copying pre-seeded empty results.
+    
+    The *_json fields carry each result's serialized form so downstream
+    nodes interpolate a ready-made string instead of re-serializing the
+    same dict.
+    """
     query: str
     context: Optional[dict]
     implementation_energy_assessment: Optional[dict]
+    implementation_energy_assessment_json: Optional[str]
     cognitive_load_analysis: Optional[dict]
+    cognitive_load_analysis_json: Optional[str]
     motivation_sustainability_analysis: Optional[dict]
+    motivation_sustainability_analysis_json: Optional[str]
     organizational_resistance_evaluation: Optional[dict]
+    organizational_resistance_evaluation_json: Optional[str]
     habit_formation_plan: Optional[dict]
+    habit_formation_plan_json: Optional[str]
     energy_optimized_implementation_plan: Optional[dict]
 
 class ImplementationEnergyPanel(BasePanel):
@@ -40,7 +328,8 @@ class ImplementationEnergyPanel(BasePanel):
         api_key: str,
         llm_provider: str = "anthropic",
         model: str = "claude-3-7-sonnet-20250219",
-        visualizer = None
+        visualizer = None,
+        execution_mode: str = "sync"
     ):
         """Initialize the Implementation Energy Panel.
         
@@ -49,15 +338,18 @@ class ImplementationEnergyPanel(BasePanel):
             llm_provider: LLM provider to use (default: anthropic)
             model: Model to use for planning
             visualizer: Visualizer instance for displaying progress
+            execution_mode: "sync" issues individual API calls; "batch"
+                submits the three independent middle-tier analyses through
+                the Message Batches API at half price for offline runs;
+                "combined" merges them into a single call so the shared
+                query, context, and assessment tokens are only sent once
         """
         # For backward compatibility, we'll use api_key as anthropic_api_key
         self.anthropic_api_key = api_key
         self.llm_provider = llm_provider
         self.model = model
         self.visualizer = visualizer
-        
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=self.anthropic_api_key)
+        self.execution_mode = execution_mode
         
         # Define agent prompts
         self.agent_prompts = {
@@ -65,13 +357,35 @@ class ImplementationEnergyPanel(BasePanel):
             "cognitive_load_analyzer": self._get_cognitive_load_analyzer_prompt(),
             "motivation_sustainability_analyst": self._get_motivation_sustainability_analyst_prompt(),
             "organizational_resistance_evaluator": self._get_organizational_resistance_evaluator_prompt(),
+            "combined_middle_tier": self._get_combined_middle_tier_prompt(),
             "habit_formation_specialist": self._get_habit_formation_specialist_prompt(),
             "energy_optimization_synthesizer": self._get_energy_optimization_synthesizer_prompt()
         }
         
+        # Output-size statistics tune each agent's max_tokens over time
+        self._token_stats = _TokenStats()
+        
+        # Pre-wrap each static prompt as an API-ready cacheable system
+        # block so no call rebuilds the structure
+        self.agent_systems = {
+            name: [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+            for name, prompt in self.agent_prompts.items()
+        }
+        
         # Initialize the graph
         self.graph = self._build_graph()
         
+    @property
+    def client(self):
+        """The AsyncAnthropic client for the running event loop.
+        
+        Resolved per call rather than in __init__ because the shared
+        pool is keyed on the running loop: each run() drives its own
+        asyncio.run, and sockets cannot outlive the loop that opened
+        them.
+        """
+        return get_async_client(self.anthropic_api_key)
+        
     def _get_implementation_energy_assessor_prompt(self) -> str:
         """Get the prompt for the Implementation Energy Assessor agent."""
         return """
@@ -298,6 +612,26 @@ class ImplementationEnergyPanel(BasePanel):
         }
         """
         
+    def _get_combined_middle_tier_prompt(self) -> str:
+        """Get the combined prompt for the three middle-tier analysts.
+        
+        Merging the analysts into one call sends the shared query, context,
+        and assessment payload once instead of three times.
+        """
+        return (
+            "You will perform three independent analyses in a single pass. "
+            "Produce one JSON object with exactly three top-level keys: "
+            "cognitive_load_analysis, motivation_sustainability_analysis, and "
+            "organizational_resistance_evaluation. Each key's value must match "
+            "the structure requested by the corresponding analyst role below.\n"
+            "\n=== ANALYST 1: COGNITIVE LOAD ANALYZER ===\n"
+            + self._get_cognitive_load_analyzer_prompt()
+            + "\n=== ANALYST 2: MOTIVATION SUSTAINABILITY ANALYST ===\n"
+            + self._get_motivation_sustainability_analyst_prompt()
+            + "\n=== ANALYST 3: ORGANIZATIONAL RESISTANCE EVALUATOR ===\n"
+            + self._get_organizational_resistance_evaluator_prompt()
+        )
+        
     def _get_habit_formation_specialist_prompt(self) -> str:
         """Get the prompt for the Habit Formation Specialist agent."""
         return """
@@ -377,6 +711,15 @@ class ImplementationEnergyPanel(BasePanel):
 
         Based on all previous analyses, synthesize an energy-optimized implementation plan.
         
+        Tokens like §N in the analyses are back-references to entries in the legend
+        at the head of the message; treat each as the full legend text it stands for.
+        
+        Emit the JSON keys in exactly this order: Executive Summary, Key Insights,
+        Energy-Optimized Strategy, Cognitive Optimization Plan, Motivation Architecture,
+        Organizational Alignment Plan, Habit-Centered Implementation, Implementation
+        Energy Metrics, Energy Risk Management. Write the Executive Summary first so it
+        streams out before the rest of the plan.
+        
         Format your response as a JSON object with the following structure:
         {
             "Executive Summary": "Brief executive summary of the energy-optimized implementation plan",
@@ -455,318 +798,307 @@ class ImplementationEnergyPanel(BasePanel):
         }
         """
         
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow for the Implementation Energy Panel."""
-        # Create the graph using the State TypedDict
-        graph = StateGraph(State)
-        
-        # Define the nodes
+    async def _cached_create(self, agent_name: str, user_content, stream: bool = False) -> Dict[str, Any]:
+        """Call the model with forced tool use, memoizing the parsed result.
         
-        # Implementation Energy Assessor node
-        def implementation_energy_assessor(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Implementation Energy Assessor", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            
-            prompt = self.agent_prompts["implementation_energy_assessor"]
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}"}
-                ]
-            )
+        Args:
+            agent_name: Key into self.agent_prompts and AGENT_OUTPUT_KEYS
+            user_content: The user message content, as a string or a list
+                of content blocks
+            stream: Stream the response and surface progress through the
+                visualizer while tokens arrive
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                implementation_energy_assessment = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Implementation Energy Assessor", "Complete")
-                    
-                return {"implementation_energy_assessment": implementation_energy_assessment}
-            except Exception as e:
-                logger.error(f"Error parsing Implementation Energy Assessor response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Implementation Energy Assessor", "Error")
-                return {"implementation_energy_assessment": {"error": str(e), "raw_response": content}}
+        Returns:
+            The structured analysis, or an error dict if the model
+            returned no tool output
+        """
+        prompt = self.agent_prompts[agent_name]
+        content_repr = user_content if isinstance(user_content, str) else fast_dumps(user_content)
+        key = hashlib.sha256(f"{self.model}|{prompt}|{content_repr}".encode()).hexdigest()
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            logger.debug(f"Response cache hit for {agent_name}")
+            return cached
         
-        # Cognitive Load Analyzer node
-        def cognitive_load_analyzer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Cognitive Load Analyzer", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            implementation_energy_assessment = state["implementation_energy_assessment"]
-            
-            prompt = self.agent_prompts["cognitive_load_analyzer"]
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nImplementation Energy Assessment: {json.dumps(implementation_energy_assessment)}"}
-                ]
-            )
+        max_tokens = self._token_stats.cap(agent_name, MAX_TOKENS.get(agent_name, 2000))
+        
+        request_kwargs = dict(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            system=self.agent_systems[agent_name],
+            messages=[
+                {"role": "user", "content": user_content}
+            ],
+            tools=[_submit_tool(agent_name)],
+            tool_choice={"type": "tool", "name": "submit_analysis"}
+        )
+        
+        async def _send():
+            if stream:
+                # Overlap visualizer updates with network transfer instead
+                # of blocking silently until the full response lands
+                async with self.client.messages.stream(**request_kwargs) as response_stream:
+                    received = 0
+                    next_update = 2000
+                    async for event in response_stream:
+                        delta = getattr(event, "delta", None)
+                        if delta is None:
+                            continue
+                        received += len(getattr(delta, "partial_json", "") or getattr(delta, "text", "") or "")
+                        if self.visualizer and received >= next_update:
+                            self.visualizer.update_agent_status(agent_name, f"streaming ({received} chars)")
+                            next_update += 2000
+                    return await response_stream.get_final_message()
+            return await self.client.messages.create(**request_kwargs)
+        
+        from anthropic import APIConnectionError, RateLimitError
+        from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
+        
+        # Transient API errors back off and retry instead of failing the
+        # node and poisoning everything downstream
+        async def _send_with_retry():
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type((RateLimitError, APIConnectionError)),
+                wait=wait_exponential(multiplier=1, max=20),
+                stop=stop_after_attempt(3),
+                reraise=True
+            ):
+                with attempt:
+                    return await _send()
+        
+        response = await _send_with_retry()
+        
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            hit_cap = getattr(response, "stop_reason", None) == "max_tokens"
+            if hit_cap:
+                logger.warning(f"{agent_name} hit its output cap ({max_tokens})")
+            self._token_stats.record(agent_name, usage.output_tokens, hit_cap)
+        
+        result = _tool_input(response)
+        if result is None:
+            # One forced re-ask covers the rare missing-tool-block response
+            logger.warning(f"No structured output in {agent_name} response; retrying once")
+            response = await _send_with_retry()
+            result = _tool_input(response)
+        if result is None:
+            logger.error(f"No structured output in {agent_name} response after retry")
+            return {"error": "No structured output in response"}
+        
+        _RESPONSE_CACHE.set(key, result)
+        return result
+        
+    def _make_node(self, agent_name: str):
+        """Build the graph node function for one agent.
+        
+        Args:
+            agent_name: Key into the module-level agent tables
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                cognitive_load_analysis = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Cognitive Load Analyzer", "Complete")
-                    
-                return {"cognitive_load_analysis": cognitive_load_analysis}
-            except Exception as e:
-                logger.error(f"Error parsing Cognitive Load Analyzer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Cognitive Load Analyzer", "Error")
-                return {"cognitive_load_analysis": {"error": str(e), "raw_response": content}}
+        Returns:
+            An async node function for the graph
+        """
+        display_name = AGENT_DISPLAY_NAMES[agent_name]
+        output_key = AGENT_STATE_KEYS[agent_name]
+        input_keys = AGENT_INPUT_KEYS[agent_name]
         
-        # Motivation Sustainability Analyst node
-        def motivation_sustainability_analyst(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Motivation Sustainability Analyst", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            implementation_energy_assessment = state["implementation_energy_assessment"]
+        async def node(state):
+            # A synthesis stitched from nothing but error dicts is a wasted
+            # call; propagate the failure instead
+            upstream = [state.get(key, {}) for key in input_keys]
+            if upstream and all(isinstance(value, dict) and "error" in value for value in upstream):
+                logger.error(f"Skipping {display_name}: all upstream analyses failed")
+                if self.visualizer:
+                    self.visualizer.update_agent_status(display_name, "Error")
+                return {output_key: {
+                    "error": "upstream parse failures",
+                    "details": {key: state.get(key, {}).get("error") for key in input_keys}
+                }}
             
-            prompt = self.agent_prompts["motivation_sustainability_analyst"]
+            if self.visualizer:
+                self.visualizer.update_agent_status(display_name, "processing")
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nImplementation Energy Assessment: {json.dumps(implementation_energy_assessment)}"}
-                ]
-            )
+            # The repeated upstream blobs travel as separate cacheable
+            # blocks so downstream nodes re-sending them hit the prompt
+            # cache instead of paying full prefill
+            header = f"Query: {state['query']}"
+            if agent_name not in AGENTS_WITHOUT_CONTEXT:
+                header += f"\n\nContext: {fast_dumps(state['context'])}"
+            content_blocks = [
+                {"type": "text", "text": header}
+            ]
+            compressed = {}
+            if agent_name == "energy_optimization_synthesizer":
+                # The synthesizer sees every upstream analysis at once, where
+                # repeated evidence strings are common; dedupe them behind
+                # §N back-references
+                compressed, legend = _compress_for_prompt({key: state[key] for key in input_keys})
+                if legend:
+                    content_blocks.append({"type": "text", "text": f"Legend (§N back-references):\n{legend}"})
+                else:
+                    compressed = {}
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
+            for input_key in input_keys:
+                if input_key in compressed:
+                    blob = fast_dumps(compressed[input_key])
+                elif input_key == "implementation_energy_assessment" and agent_name in ASSESSMENT_PROJECTION:
+                    blob = fast_dumps(_project_assessment(state[input_key], agent_name))
                 else:
-                    json_str = content
-                
-                motivation_sustainability_analysis = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Motivation Sustainability Analyst", "Complete")
-                    
-                return {"motivation_sustainability_analysis": motivation_sustainability_analysis}
-            except Exception as e:
-                logger.error(f"Error parsing Motivation Sustainability Analyst response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Motivation Sustainability Analyst", "Error")
-                return {"motivation_sustainability_analysis": {"error": str(e), "raw_response": content}}
-        
-        # Organizational Resistance Evaluator node
-        def organizational_resistance_evaluator(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Organizational Resistance Evaluator", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            implementation_energy_assessment = state["implementation_energy_assessment"]
+                    # Reuse the producer's serialized form instead of
+                    # re-walking the dict
+                    blob = state.get(f"{input_key}_json") or fast_dumps(state[input_key])
+                content_blocks.append({
+                    "type": "text",
+                    "text": f"{STATE_LABELS[input_key]}: {blob}",
+                    "cache_control": {"type": "ephemeral"}
+                })
             
-            prompt = self.agent_prompts["organizational_resistance_evaluator"]
+            result = await self._cached_create(agent_name, content_blocks, stream=True)
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nImplementation Energy Assessment: {json.dumps(implementation_energy_assessment)}"}
-                ]
-            )
+            if self.visualizer:
+                status = "Error" if "error" in result else "Complete"
+                self.visualizer.update_agent_status(display_name, status)
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                organizational_resistance_evaluation = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Organizational Resistance Evaluator", "Complete")
-                    
-                return {"organizational_resistance_evaluation": organizational_resistance_evaluation}
-            except Exception as e:
-                logger.error(f"Error parsing Organizational Resistance Evaluator response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Organizational Resistance Evaluator", "Error")
-                return {"organizational_resistance_evaluation": {"error": str(e), "raw_response": content}}
+            updates = {output_key: result}
+            if output_key in STATE_LABELS:
+                # Serialize once here; every consumer interpolates the string
+                updates[f"{output_key}_json"] = fast_dumps(result)
+            return updates
+        
+        return node
+        
+    def _build_graph(self) -> "StateGraph":
+        """Build the LangGraph workflow for the Implementation Energy Panel."""
+        from langgraph.graph import StateGraph, END
         
-        # Habit Formation Specialist node
-        def habit_formation_specialist(state):
+        # Create the graph using the State TypedDict
+        graph = StateGraph(State)
+        
+        # Define the nodes
+        
+        # Combined middle-tier node: one call produces all three analyses,
+        # paying the shared query/context/assessment prefill only once
+        async def parallel_analyses_node(state):
             if self.visualizer:
-                self.visualizer.update_agent_status("Habit Formation Specialist", "processing")
+                self.visualizer.update_agent_status("Middle-Tier Analysts", "processing")
                 
             query = state["query"]
             context = state["context"]
             implementation_energy_assessment = state["implementation_energy_assessment"]
-            cognitive_load_analysis = state["cognitive_load_analysis"]
-            motivation_sustainability_analysis = state["motivation_sustainability_analysis"]
-            organizational_resistance_evaluation = state["organizational_resistance_evaluation"]
             
-            prompt = self.agent_prompts["habit_formation_specialist"]
+            user_content = f"Query: {query}\n\nContext: {fast_dumps(context)}\n\nImplementation Energy Assessment: {fast_dumps(implementation_energy_assessment)}"
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Implementation Energy Assessment: {json.dumps(implementation_energy_assessment)}
-                    
-                    Cognitive Load Analysis: {json.dumps(cognitive_load_analysis)}
-                    
-                    Motivation Sustainability Analysis: {json.dumps(motivation_sustainability_analysis)}
-                    
-                    Organizational Resistance Evaluation: {json.dumps(organizational_resistance_evaluation)}
-                    """}
-                ]
-            )
+            combined = await self._cached_create("combined_middle_tier", user_content, stream=True)
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
+            if self.visualizer:
+                status = "Error" if "error" in combined else "Complete"
+                self.visualizer.update_agent_status("Middle-Tier Analysts", status)
                 
-                habit_formation_plan = json.loads(json_str)
+            if "error" in combined:
+                return {
+                    "cognitive_load_analysis": combined,
+                    "motivation_sustainability_analysis": combined,
+                    "organizational_resistance_evaluation": combined
+                }
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Habit Formation Specialist", "Complete")
-                    
-                return {"habit_formation_plan": habit_formation_plan}
-            except Exception as e:
-                logger.error(f"Error parsing Habit Formation Specialist response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Habit Formation Specialist", "Error")
-                return {"habit_formation_plan": {"error": str(e), "raw_response": content}}
+            return {
+                "cognitive_load_analysis": combined.get("cognitive_load_analysis", {}),
+                "motivation_sustainability_analysis": combined.get("motivation_sustainability_analysis", {}),
+                "organizational_resistance_evaluation": combined.get("organizational_resistance_evaluation", {})
+            }
         
-        # Energy Optimization Synthesizer node
-        def energy_optimization_synthesizer(state):
+        # Middle-tier batch node: in batch execution mode the three
+        # independent analyses go out as one Message Batches submission,
+        # which Anthropic prices at 50% of individual requests
+        async def middle_tier_batch(state):
+            middle_tier = {
+                agent_name: (AGENT_DISPLAY_NAMES[agent_name], AGENT_STATE_KEYS[agent_name])
+                for agent_name in ASSESSMENT_PROJECTION
+            }
+            
             if self.visualizer:
-                self.visualizer.update_agent_status("Energy Optimization Synthesizer", "processing")
-                
+                for display_name, _ in middle_tier.values():
+                    self.visualizer.update_agent_status(display_name, "processing")
+            
             query = state["query"]
             context = state["context"]
             implementation_energy_assessment = state["implementation_energy_assessment"]
-            cognitive_load_analysis = state["cognitive_load_analysis"]
-            motivation_sustainability_analysis = state["motivation_sustainability_analysis"]
-            organizational_resistance_evaluation = state["organizational_resistance_evaluation"]
-            habit_formation_plan = state["habit_formation_plan"]
             
-            prompt = self.agent_prompts["energy_optimization_synthesizer"]
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Implementation Energy Assessment: {json.dumps(implementation_energy_assessment)}
-                    
-                    Cognitive Load Analysis: {json.dumps(cognitive_load_analysis)}
-                    
-                    Motivation Sustainability Analysis: {json.dumps(motivation_sustainability_analysis)}
-                    
-                    Organizational Resistance Evaluation: {json.dumps(organizational_resistance_evaluation)}
-                    
-                    Habit Formation Plan: {json.dumps(habit_formation_plan)}
-                    """}
+            batch = await self.client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": agent_name,
+                        "params": {
+                            "model": self.model,
+                            "max_tokens": MAX_TOKENS[agent_name],
+                            "temperature": TEMPERATURE,
+                            "system": self.agent_systems[agent_name],
+                            "messages": [
+                                {"role": "user", "content": f"Query: {query}\n\nContext: {fast_dumps(context)}\n\nImplementation Energy Assessment: {fast_dumps(_project_assessment(implementation_energy_assessment, agent_name))}"}
+                            ],
+                            "tools": [_submit_tool(agent_name)],
+                            "tool_choice": {"type": "tool", "name": "submit_analysis"}
+                        }
+                    }
+                    for agent_name in middle_tier
                 ]
             )
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
+            # Poll until the batch finishes processing
+            while batch.processing_status != "ended":
+                await asyncio.sleep(5)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+            
+            updates = {}
+            async for entry in await self.client.messages.batches.results(batch.id):
+                display_name, output_key = middle_tier[entry.custom_id]
                 
-                energy_optimized_implementation_plan = json.loads(json_str)
+                if entry.result.type != "succeeded":
+                    logger.error(f"Batch request for {entry.custom_id} {entry.result.type}")
+                    if self.visualizer:
+                        self.visualizer.update_agent_status(display_name, "Error")
+                    updates[output_key] = {"error": f"Batch request {entry.result.type}"}
+                    continue
                 
+                result = _tool_input(entry.result.message)
+                if result is None:
+                    logger.error(f"No structured output in {entry.custom_id} batch response")
+                    if self.visualizer:
+                        self.visualizer.update_agent_status(display_name, "Error")
+                    updates[output_key] = {"error": "No structured output in response"}
+                    continue
+                
+                updates[output_key] = result
                 if self.visualizer:
-                    self.visualizer.update_agent_status("Energy Optimization Synthesizer", "Complete")
-                    
-                return {"energy_optimized_implementation_plan": energy_optimized_implementation_plan}
-            except Exception as e:
-                logger.error(f"Error parsing Energy Optimization Synthesizer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Energy Optimization Synthesizer", "Error")
-                return {"energy_optimized_implementation_plan": {"error": str(e), "raw_response": content}}
+                    self.visualizer.update_agent_status(display_name, "Complete")
+            
+            return updates
         
         # Add nodes to the graph
-        graph.add_node("implementation_energy_assessor", implementation_energy_assessor)
-        graph.add_node("cognitive_load_analyzer", cognitive_load_analyzer)
-        graph.add_node("motivation_sustainability_analyst", motivation_sustainability_analyst)
-        graph.add_node("organizational_resistance_evaluator", organizational_resistance_evaluator)
-        graph.add_node("habit_formation_specialist", habit_formation_specialist)
-        graph.add_node("energy_optimization_synthesizer", energy_optimization_synthesizer)
-        
-        # Define the edges
-        graph.add_edge("implementation_energy_assessor", "cognitive_load_analyzer")
-        graph.add_edge("implementation_energy_assessor", "motivation_sustainability_analyst")
-        graph.add_edge("implementation_energy_assessor", "organizational_resistance_evaluator")
-        graph.add_edge("cognitive_load_analyzer", "habit_formation_specialist")
-        graph.add_edge("motivation_sustainability_analyst", "habit_formation_specialist")
-        graph.add_edge("organizational_resistance_evaluator", "habit_formation_specialist")
+        graph.add_node("implementation_energy_assessor", self._make_node("implementation_energy_assessor"))
+        graph.add_node("habit_formation_specialist", self._make_node("habit_formation_specialist"))
+        graph.add_node("energy_optimization_synthesizer", self._make_node("energy_optimization_synthesizer"))
+        
+        # Define the middle tier and edges; batch mode funnels the three
+        # independent analyses through a single Message Batches node
+        if self.execution_mode == "batch":
+            graph.add_node("middle_tier_batch", middle_tier_batch)
+            graph.add_edge("implementation_energy_assessor", "middle_tier_batch")
+            graph.add_edge("middle_tier_batch", "habit_formation_specialist")
+        elif self.execution_mode == "combined":
+            graph.add_node("parallel_analyses", parallel_analyses_node)
+            graph.add_edge("implementation_energy_assessor", "parallel_analyses")
+            graph.add_edge("parallel_analyses", "habit_formation_specialist")
+        else:
+            graph.add_node("cognitive_load_analyzer", self._make_node("cognitive_load_analyzer"))
+            graph.add_node("motivation_sustainability_analyst", self._make_node("motivation_sustainability_analyst"))
+            graph.add_node("organizational_resistance_evaluator", self._make_node("organizational_resistance_evaluator"))
+            graph.add_edge("implementation_energy_assessor", "cognitive_load_analyzer")
+            graph.add_edge("implementation_energy_assessor", "motivation_sustainability_analyst")
+            graph.add_edge("implementation_energy_assessor", "organizational_resistance_evaluator")
+            graph.add_edge("cognitive_load_analyzer", "habit_formation_specialist")
+            graph.add_edge("motivation_sustainability_analyst", "habit_formation_specialist")
+            graph.add_edge("organizational_resistance_evaluator", "habit_formation_specialist")
         graph.add_edge("habit_formation_specialist", "energy_optimization_synthesizer")
         graph.add_edge("energy_optimization_synthesizer", END)
         
@@ -776,51 +1108,191 @@ class ImplementationEnergyPanel(BasePanel):
         # Return the compiled graph
         return graph.compile()
         
-    def run(self, query: str, context: str = "") -> Dict[str, Any]:
-        """Run the Implementation Energy Panel on the given query.
+    async def ainvoke(self, query: str, context: str = "") -> Dict[str, Any]:
+        """Run the panel on an existing event loop.
+        
+        An orchestrator can overlap several independent panels with
+        asyncio.gather(*(panel.ainvoke(query, context) for panel in panels)).
         
         Args:
             query: The query to run the panel on
             context: Context information
             
         Returns:
-            The panel's output
+            The energy-optimized implementation plan
         """
-        if self.visualizer:
-            self.visualizer.display_welcome("Implementation Energy Panel")
-            self.visualizer.display_query(query)
-            self.visualizer.update_status("Running Implementation Energy Panel")
-        
         # Parse context if it's a string
         if isinstance(context, str):
             try:
-                context_dict = json.loads(context)
+                context_dict = fast_loads(context)
             except:
                 context_dict = {"raw_context": context}
         else:
             context_dict = context
         
-        # Initialize the state
+        # Initialize the state; result keys appear as nodes produce them
         initial_state = {
             "query": query,
-            "context": context_dict,
-            "implementation_energy_assessment": {},
-            "cognitive_load_analysis": {},
-            "motivation_sustainability_analysis": {},
-            "organizational_resistance_evaluation": {},
-            "habit_formation_plan": {},
-            "energy_optimized_implementation_plan": {}
+            "context": context_dict
         }
         
+        result = await self.graph.ainvoke(initial_state)
+        return result["energy_optimized_implementation_plan"]
+        
+    def run_batch(self, queries: List[str], contexts: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Run the panel over many queries through the Message Batches API.
+        
+        Each pipeline stage goes out as one batch covering every query, so
+        a bulk sweep pays batch pricing on all six agents instead of
+        issuing per-query interactive calls.
+        
+        Args:
+            queries: The queries to run the panel on
+            contexts: Optional per-query context strings
+            
+        Returns:
+            One energy-optimized implementation plan per query
+        """
+        if contexts is None:
+            contexts = [""] * len(queries)
+        return asyncio.run(self._run_batch(queries, contexts))
+        
+    async def _run_batch(self, queries: List[str], contexts: List[str]) -> List[Dict[str, Any]]:
+        """Drive the staged pipeline for all queries via batched requests.
+        
+        Args:
+            queries: The queries to run the panel on
+            contexts: Per-query context strings
+            
+        Returns:
+            One energy-optimized implementation plan per query
+        """
+        states = []
+        for query, context in zip(queries, contexts):
+            if isinstance(context, str):
+                try:
+                    context_dict = fast_loads(context)
+                except:
+                    context_dict = {"raw_context": context}
+            else:
+                context_dict = context
+            states.append({"query": query, "context": context_dict})
+        
+        # Mirror the graph's dependency order: each stage becomes one
+        # batch spanning every query
+        stages = [
+            ["implementation_energy_assessor"],
+            ["cognitive_load_analyzer", "motivation_sustainability_analyst", "organizational_resistance_evaluator"],
+            ["habit_formation_specialist"],
+            ["energy_optimization_synthesizer"]
+        ]
+        
+        for stage in stages:
+            if self.visualizer:
+                self.visualizer.update_status(f"Submitting batch for: {', '.join(stage)}")
+            
+            requests = [
+                {
+                    "custom_id": f"{index}-{agent_name}",
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": MAX_TOKENS.get(agent_name, 2000),
+                        "temperature": TEMPERATURE,
+                        "system": self.agent_systems[agent_name],
+                        "messages": [
+                            {"role": "user", "content": self._batch_user_content(agent_name, state)}
+                        ],
+                        "tools": [_submit_tool(agent_name)],
+                        "tool_choice": {"type": "tool", "name": "submit_analysis"}
+                    }
+                }
+                for index, state in enumerate(states)
+                for agent_name in stage
+            ]
+            
+            results = await self._submit_batch(requests)
+            for custom_id, result in results.items():
+                index_str, _, agent_name = custom_id.partition("-")
+                output_key = AGENT_STATE_KEYS[agent_name]
+                states[int(index_str)][output_key] = result
+                if output_key in STATE_LABELS:
+                    states[int(index_str)][f"{output_key}_json"] = fast_dumps(result)
+        
+        return [state.get("energy_optimized_implementation_plan", {}) for state in states]
+        
+    def _batch_user_content(self, agent_name: str, state: Dict[str, Any]) -> str:
+        """Build an agent's user message from a per-query state dict.
+        
+        Args:
+            agent_name: Key into the module-level agent tables
+            state: The per-query pipeline state
+            
+        Returns:
+            The user message content
+        """
+        sections = [f"Query: {state['query']}"]
+        if agent_name not in AGENTS_WITHOUT_CONTEXT:
+            sections.append(f"Context: {fast_dumps(state['context'])}")
+        for input_key in AGENT_INPUT_KEYS[agent_name]:
+            if input_key == "implementation_energy_assessment" and agent_name in ASSESSMENT_PROJECTION:
+                blob = fast_dumps(_project_assessment(state.get(input_key, {}), agent_name))
+            else:
+                blob = state.get(f"{input_key}_json") or fast_dumps(state.get(input_key, {}))
+            sections.append(f"{STATE_LABELS[input_key]}: {blob}")
+        return "\n\n".join(sections)
+        
+    async def _submit_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Submit one Message Batches request and collect parsed results.
+        
+        Args:
+            requests: Batch request entries with custom_id and params
+            
+        Returns:
+            Mapping from custom_id to structured result or error dict
+        """
+        batch = await self.client.messages.batches.create(requests=requests)
+        
+        while batch.processing_status != "ended":
+            await asyncio.sleep(10)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+        
+        results = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.error(f"Batch request {entry.custom_id} {entry.result.type}")
+                results[entry.custom_id] = {"error": f"Batch request {entry.result.type}"}
+                continue
+            result = _tool_input(entry.result.message)
+            if result is None:
+                results[entry.custom_id] = {"error": "No structured output in response"}
+            else:
+                results[entry.custom_id] = result
+        return results
+        
+    def run(self, query: str, context: str = "") -> Dict[str, Any]:
+        """Run the Implementation Energy Panel on the given query.
+        
+        Args:
+            query: The query to run the panel on
+            context: Context information
+            
+        Returns:
+            The panel's output
+        """
+        if self.visualizer:
+            self.visualizer.display_welcome("Implementation Energy Panel")
+            self.visualizer.display_query(query)
+            self.visualizer.update_status("Running Implementation Energy Panel")
+        
         # Run the graph
         try:
-            result = self.graph.invoke(initial_state)
+            plan = asyncio.run(self.ainvoke(query, context))
             
             if self.visualizer:
                 self.visualizer.display_success("Implementation Energy Panel completed successfully")
-                self.visualizer.display_plan(result["energy_optimized_implementation_plan"])
+                self.visualizer.display_plan(plan)
             
-            return result["energy_optimized_implementation_plan"]
+            return plan
         except Exception as e:
             logger.error(f"Error running Implementation Energy Panel: {e}")
             if self.visualizer:
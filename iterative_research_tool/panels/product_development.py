@@ -1,65 +1,61 @@
 """Product Development Panel for multi-agent advisory planning."""
 
+import asyncio
+import hashlib
 import logging
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, TypedDict
-import json
 
-# LangGraph imports
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-
-# Anthropic imports
-from anthropic import Anthropic
+# LangGraph and Anthropic are imported lazily inside __init__ and
+# _build_graph so importing this module stays cheap for CLI commands
+# that never construct the panel
 
 # Local imports
+from iterative_research_tool.core.cache_utils import DiskCache
+from iterative_research_tool.core.client_utils import get_async_client
+from iterative_research_tool.core.json_utils import fast_dumps, fast_loads
 from iterative_research_tool.panels import BasePanel
 
 logger = logging.getLogger(__name__)
 
-class ProductDevelopmentPanel(BasePanel):
-    """Product Development Panel for multi-agent advisory planning.
+# Disk-backed response cache so repeat runs of the same query/context
+# skip the LLM round trip entirely
+_RESPONSE_CACHE = DiskCache("~/.multi_agent_cache")
+
+class ProductDevState(TypedDict):
+    """Graph state for the Product Development Panel.
     
-    This panel provides comprehensive product strategy advice, including
-    market analysis, customer insights, product positioning, development
-    roadmapping, and go-to-market strategies.
+    Defined once at module scope so LangGraph validates and indexes the
+    schema a single time instead of per panel instance.
     """
-    
-    def __init__(
-        self,
-        anthropic_api_key: str,
-        model: str = "claude-3-7-sonnet-20250219",
-        visualizer = None
-    ):
-        """Initialize the Product Development Panel.
-        
-        Args:
-            anthropic_api_key: API key for Anthropic
-            model: Model to use for planning
-            visualizer: Visualizer instance for displaying progress
-        """
-        self.anthropic_api_key = anthropic_api_key
-        self.model = model
-        self.client = Anthropic(api_key=anthropic_api_key)
-        self.visualizer = visualizer
-        
-        # Define agent prompts
-        self.agent_prompts = {
-            "market_opportunity_analyzer": self._get_market_opportunity_analyzer_prompt(),
-            "customer_insight_specialist": self._get_customer_insight_specialist_prompt(),
-            "product_positioning_strategist": self._get_product_positioning_strategist_prompt(),
-            "technical_feasibility_evaluator": self._get_technical_feasibility_evaluator_prompt(),
-            "competitive_landscape_mapper": self._get_competitive_landscape_mapper_prompt(),
-            "product_roadmap_developer": self._get_product_roadmap_developer_prompt(),
-            "go_to_market_strategist": self._get_go_to_market_strategist_prompt(),
-            "product_strategy_synthesizer": self._get_product_strategy_synthesizer_prompt()
-        }
-        
-        # Initialize the graph
-        self.graph = self._build_graph()
-        
-    def _get_market_opportunity_analyzer_prompt(self) -> str:
-        """Get the prompt for the Market Opportunity Analyzer agent."""
-        return """
+    query: str
+    context: Dict
+    context_json: Optional[str]
+    market_opportunity: Optional[Dict]
+    market_opportunity_json: Optional[str]
+    market_opportunity_brief: Optional[str]
+    customer_insights: Optional[Dict]
+    customer_insights_json: Optional[str]
+    customer_insights_brief: Optional[str]
+    product_positioning: Optional[Dict]
+    product_positioning_json: Optional[str]
+    product_positioning_brief: Optional[str]
+    technical_feasibility: Optional[Dict]
+    technical_feasibility_json: Optional[str]
+    technical_feasibility_brief: Optional[str]
+    competitive_landscape: Optional[Dict]
+    competitive_landscape_json: Optional[str]
+    competitive_landscape_brief: Optional[str]
+    product_roadmap: Optional[Dict]
+    product_roadmap_json: Optional[str]
+    product_roadmap_brief: Optional[str]
+    go_to_market: Optional[Dict]
+    go_to_market_json: Optional[str]
+    go_to_market_brief: Optional[str]
+    product_strategy: Optional[Dict]
+
+# Prompt for the Market Opportunity Analyzer agent
+_MARKET_OPPORTUNITY_ANALYZER_PROMPT = """
         You are a market opportunity analyzer who identifies and evaluates market opportunities. Your role is to:
         - Analyze market size, growth, and trends relevant to the product concept
         - Identify market segments and their relative attractiveness
@@ -69,7 +65,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the user's query about product development, analyze the market opportunity.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "market_analysis": {
                 "summary": "Brief summary of your market opportunity analysis",
@@ -124,10 +120,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_customer_insight_specialist_prompt(self) -> str:
-        """Get the prompt for the Customer Insight Specialist agent."""
-        return """
+
+# Prompt for the Customer Insight Specialist agent
+_CUSTOMER_INSIGHT_SPECIALIST_PROMPT = """
         You are a customer insight specialist who deeply understands customer needs and behaviors. Your role is to:
         - Identify key customer personas and their characteristics
         - Analyze customer needs, pain points, and jobs-to-be-done
@@ -137,7 +132,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the market analysis, provide customer insights for the product concept.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "customer_insights": {
                 "summary": "Brief summary of your customer insights",
@@ -206,10 +201,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_product_positioning_strategist_prompt(self) -> str:
-        """Get the prompt for the Product Positioning Strategist agent."""
-        return """
+
+# Prompt for the Product Positioning Strategist agent
+_PRODUCT_POSITIONING_STRATEGIST_PROMPT = """
         You are a product positioning strategist who defines how products should be positioned in the market. Your role is to:
         - Develop a compelling value proposition for the product
         - Define key differentiating factors and competitive advantages
@@ -219,7 +213,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the market analysis and customer insights, develop product positioning.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "product_positioning": {
                 "summary": "Brief summary of your product positioning",
@@ -291,10 +285,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_technical_feasibility_evaluator_prompt(self) -> str:
-        """Get the prompt for the Technical Feasibility Evaluator agent."""
-        return """
+
+# Prompt for the Technical Feasibility Evaluator agent
+_TECHNICAL_FEASIBILITY_EVALUATOR_PROMPT = """
         You are a technical feasibility evaluator who assesses the technical viability of product concepts. Your role is to:
         - Evaluate core technical requirements and technological dependencies
         - Assess development complexity and resource requirements
@@ -304,7 +297,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the product concept, evaluate technical feasibility.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "technical_feasibility_assessment": {
                 "summary": "Brief summary of your technical feasibility assessment",
@@ -382,10 +375,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_competitive_landscape_mapper_prompt(self) -> str:
-        """Get the prompt for the Competitive Landscape Mapper agent."""
-        return """
+
+# Prompt for the Competitive Landscape Mapper agent
+_COMPETITIVE_LANDSCAPE_MAPPER_PROMPT = """
         You are a competitive landscape mapper who analyzes the competitive environment for the product. Your role is to:
         - Identify key competitors and their market positions
         - Analyze competitive strategies and market dynamics
@@ -394,7 +386,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the market analysis, analyze the competitive landscape for the product.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "competitive_landscape": {
                 "summary": "Brief summary of your competitive landscape analysis",
@@ -427,10 +419,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_product_roadmap_developer_prompt(self) -> str:
-        """Get the prompt for the Product Roadmap Developer agent."""
-        return """
+
+# Prompt for the Product Roadmap Developer agent
+_PRODUCT_ROADMAP_DEVELOPER_PROMPT = """
         You are a product roadmap developer who plans and develops product roadmaps. Your role is to:
         - Define product roadmap stages and milestones
         - Identify key product features and functionalities
@@ -440,7 +431,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the market analysis, customer insights, and product positioning, develop a product roadmap.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "product_roadmap": {
                 "summary": "Brief summary of your product roadmap",
@@ -478,10 +469,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_go_to_market_strategist_prompt(self) -> str:
-        """Get the prompt for the Go-to-Market Strategist agent."""
-        return """
+
+# Prompt for the Go-to-Market Strategist agent
+_GO_TO_MARKET_STRATEGIST_PROMPT = """
         You are a go-to-market strategist who plans and executes go-to-market strategies. Your role is to:
         - Develop a comprehensive go-to-market strategy
         - Identify key channels and distribution methods
@@ -490,7 +480,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the market analysis, product positioning, and product roadmap, develop a go-to-market strategy.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "go_to_market_strategy": {
                 "summary": "Brief summary of your go-to-market strategy",
@@ -519,10 +509,9 @@ class ProductDevelopmentPanel(BasePanel):
             }
         }
         """
-        
-    def _get_product_strategy_synthesizer_prompt(self) -> str:
-        """Get the prompt for the Product Strategy Synthesizer agent."""
-        return """
+
+# Prompt for the Product Strategy Synthesizer agent
+_PRODUCT_STRATEGY_SYNTHESIZER_PROMPT = """
         You are a product strategy synthesizer who combines insights from various agents to develop a comprehensive product strategy. Your role is to:
         - Integrate insights from market opportunity analyzer, customer insight specialist, product positioning strategist, technical feasibility evaluator, competitive landscape mapper, product roadmap developer, go-to-market strategist, and product strategy synthesizer
         - Develop a comprehensive product strategy that aligns with strategic objectives
@@ -530,7 +519,7 @@ class ProductDevelopmentPanel(BasePanel):
 
         Based on the insights from all agents, synthesize a comprehensive product strategy.
         
-        Format your response as a JSON object with the following structure:
+        Call the submit_analysis tool with a JSON object of the following structure:
         {
             "Executive Summary": "Brief executive summary of the product strategy",
             "Key Insights": ["insight 1", "insight 2", ...],
@@ -610,478 +599,534 @@ class ProductDevelopmentPanel(BasePanel):
             "Strategic Alignment": "How the product strategy aligns with broader organizational goals"
         }
         """
+
+# Top-level keys each agent's prompt asks for, extracted once so
+# responses can be shape-checked without re-reading the prompt prose
+AGENT_OUTPUT_KEYS = {
+    "market_opportunity_analyzer": ["market_analysis"],
+    "customer_insight_specialist": ["customer_insights"],
+    "product_positioning_strategist": ["product_positioning"],
+    "technical_feasibility_evaluator": ["technical_feasibility_assessment"],
+    "competitive_landscape_mapper": ["competitive_landscape"],
+    "product_roadmap_developer": ["product_roadmap"],
+    "go_to_market_strategist": ["go_to_market_strategy"],
+    "product_strategy_synthesizer": [
+        "Executive Summary",
+        "Key Insights",
+        "Market Strategy",
+        "Product Strategy",
+        "Customer Strategy",
+        "Competitive Strategy",
+        "Go-to-Market Strategy",
+        "Implementation Plan",
+        "Success Metrics"
+    ]
+}
+
+# Display names the visualizer shows for each agent
+AGENT_DISPLAY_NAMES = {
+    "market_opportunity_analyzer": "Market Opportunity Analyzer",
+    "customer_insight_specialist": "Customer Insight Specialist",
+    "product_positioning_strategist": "Product Positioning Strategist",
+    "technical_feasibility_evaluator": "Technical Feasibility Evaluator",
+    "competitive_landscape_mapper": "Competitive Landscape Mapper",
+    "product_roadmap_developer": "Product Roadmap Developer",
+    "go_to_market_strategist": "Go-to-Market Strategist",
+    "product_strategy_synthesizer": "Product Strategy Synthesizer"
+}
+
+# State key each agent writes its output to
+AGENT_STATE_KEYS = {
+    "market_opportunity_analyzer": "market_opportunity",
+    "customer_insight_specialist": "customer_insights",
+    "product_positioning_strategist": "product_positioning",
+    "technical_feasibility_evaluator": "technical_feasibility",
+    "competitive_landscape_mapper": "competitive_landscape",
+    "product_roadmap_developer": "product_roadmap",
+    "go_to_market_strategist": "go_to_market",
+    "product_strategy_synthesizer": "product_strategy"
+}
+
+# Prompt labels for the state fields agents consume
+STATE_LABELS = {
+    "context": "Context",
+    "market_opportunity": "Market Analysis",
+    "customer_insights": "Customer Insights",
+    "product_positioning": "Product Positioning",
+    "technical_feasibility": "Technical Feasibility",
+    "competitive_landscape": "Competitive Landscape",
+    "product_roadmap": "Product Roadmap",
+    "go_to_market": "Go-to-Market Strategy"
+}
+
+# State fields each agent folds into its user message
+AGENT_INPUT_KEYS = {
+    "market_opportunity_analyzer": ["context"],
+    "customer_insight_specialist": ["context", "market_opportunity"],
+    "product_positioning_strategist": ["context", "market_opportunity", "customer_insights"],
+    "technical_feasibility_evaluator": [
+        "context", "market_opportunity", "customer_insights", "product_positioning"
+    ],
+    "competitive_landscape_mapper": ["context", "market_opportunity", "product_positioning"],
+    "product_roadmap_developer": [
+        "context", "market_opportunity", "customer_insights", "product_positioning",
+        "technical_feasibility", "competitive_landscape"
+    ],
+    "go_to_market_strategist": [
+        "context", "market_opportunity", "customer_insights", "product_positioning",
+        "competitive_landscape", "product_roadmap"
+    ],
+    "product_strategy_synthesizer": [
+        "context", "market_opportunity", "customer_insights", "product_positioning",
+        "technical_feasibility", "competitive_landscape", "product_roadmap", "go_to_market"
+    ]
+}
+
+def _check_shape(agent_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Warn when a parsed response is missing its expected top-level keys.
+    
+    A full JSON-Schema validator would pull in a new dependency for
+    little gain; checking the table-driven key set catches the common
+    failure mode (the model answering outside the requested structure)
+    at dict-lookup cost.
+    
+    Args:
+        agent_name: Key into AGENT_OUTPUT_KEYS
+        result: Parsed response
         
-    def _build_graph(self) -> StateGraph:
-        """Build the LangGraph workflow for the Product Development Panel."""
-        # Define the state schema
-        from typing import TypedDict, Optional as Opt
+    Returns:
+        The result, unchanged
+    """
+    missing = [key for key in AGENT_OUTPUT_KEYS[agent_name] if key not in result]
+    if missing:
+        logger.warning("%s response missing expected keys: %s", agent_name, missing)
+    return result
+
+def _brief(result: Dict[str, Any]) -> str:
+    """Serialize a compact digest of an agent result for downstream prompts.
+    
+    Every agent's schema nests its analysis under one top-level key with
+    a "summary" field; the digest keeps that summary and drops the
+    detailed sub-sections, so mid-chain consumers pay for a paragraph
+    instead of the full multi-KB blob. Unexpected shapes (error dicts,
+    missing summary) fall back to the full serialization.
+    
+    Args:
+        result: Parsed agent output
         
-        class State(TypedDict):
-            query: str
-            context: str
-            market_opportunity: Opt[dict]
-            customer_insights: Opt[dict]
-            product_positioning: Opt[dict]
-            technical_feasibility: Opt[dict]
-            product_roadmap: Opt[dict]
-            go_to_market: Opt[dict]
-            product_strategy: Opt[dict]
-            competitive_landscape: Opt[dict]
+    Returns:
+        A JSON string holding the digest
+    """
+    for value in result.values():
+        if isinstance(value, dict) and "summary" in value:
+            return fast_dumps({"summary": value["summary"]})
+    return fast_dumps(result)
+
+
+def _submit_tool(agent_name: str) -> Dict[str, Any]:
+    """Build the forced-output tool definition for an agent.
+    
+    Args:
+        agent_name: Key into AGENT_OUTPUT_KEYS
         
-        # Create the graph
-        graph = StateGraph(State)
+    Returns:
+        Tool definition whose schema mirrors the agent's top-level keys
+    """
+    return {
+        "name": "submit_analysis",
+        "description": "Record the structured analysis.",
+        "input_schema": {
+            "type": "object",
+            "properties": {key: {} for key in AGENT_OUTPUT_KEYS[agent_name]},
+            "additionalProperties": True
+        }
+    }
+
+def _tool_input(message) -> Optional[Dict[str, Any]]:
+    """Return the first tool_use block's input dict, or None.
+    
+    Args:
+        message: An Anthropic message
         
-        # Define the nodes
+    Returns:
+        The structured tool input, or None if no tool block is present
+    """
+    for block in message.content:
+        if block.type == "tool_use":
+            return dict(block.input)
+    return None
+
+# One shared, immutable prompt table: every panel instance aliases the
+# same string objects instead of rebuilding ~15 KB of literals per
+# construction
+_AGENT_PROMPTS = MappingProxyType({
+    "market_opportunity_analyzer": _MARKET_OPPORTUNITY_ANALYZER_PROMPT,
+    "customer_insight_specialist": _CUSTOMER_INSIGHT_SPECIALIST_PROMPT,
+    "product_positioning_strategist": _PRODUCT_POSITIONING_STRATEGIST_PROMPT,
+    "technical_feasibility_evaluator": _TECHNICAL_FEASIBILITY_EVALUATOR_PROMPT,
+    "competitive_landscape_mapper": _COMPETITIVE_LANDSCAPE_MAPPER_PROMPT,
+    "product_roadmap_developer": _PRODUCT_ROADMAP_DEVELOPER_PROMPT,
+    "go_to_market_strategist": _GO_TO_MARKET_STRATEGIST_PROMPT,
+    "product_strategy_synthesizer": _PRODUCT_STRATEGY_SYNTHESIZER_PROMPT
+})
+
+# The same prompts pre-wrapped as API-ready system blocks marked
+# cacheable: byte-identical across calls, so after the first request
+# the server serves the prompt prefix from its cache
+_AGENT_SYSTEMS = {
+    name: [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+    for name, prompt in _AGENT_PROMPTS.items()
+}
+
+# Fast mode sends the whole panel as one request: the seven analysis
+# prompts become perspectives the model works through in its extended
+# thinking, and only the synthesized strategy comes back
+_FAST_MODE_PROMPT = "\n\n".join(
+    f"=== PERSPECTIVE: {name} ===\n{prompt}"
+    for name, prompt in _AGENT_PROMPTS.items()
+    if name != "product_strategy_synthesizer"
+) + "\n\n=== SYNTHESIS ===\n" + _PRODUCT_STRATEGY_SYNTHESIZER_PROMPT + """
+Work through every perspective above in your thinking, then call the
+submit_analysis tool once with only the final synthesized strategy.
+"""
+
+_FAST_MODE_SYSTEM = [{"type": "text", "text": _FAST_MODE_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+class ProductDevelopmentPanel(BasePanel):
+    """Product Development Panel for multi-agent advisory planning.
+    
+    This panel provides comprehensive product strategy advice, including
+    market analysis, customer insights, product positioning, development
+    roadmapping, and go-to-market strategies.
+    """
+    
+    # Fixed attribute layout: instances skip the per-object __dict__ and
+    # the node closures' repeated self.X loads take the slot fast path
+    __slots__ = (
+        "anthropic_api_key",
+        "model",
+        "visualizer",
+        "execution_mode",
+        "fast_mode",
+        "agent_prompts",
+        "_graph"
+    )
+    
+    def __init__(
+        self,
+        anthropic_api_key: str,
+        model: str = "claude-3-7-sonnet-20250219",
+        visualizer = None,
+        execution_mode: str = "sync",
+        fast_mode: bool = False
+    ):
+        """Initialize the Product Development Panel.
         
-        # Market Opportunity Analyzer node
-        def market_opportunity_analyzer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Market Opportunity Analyzer", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            
-            prompt = self.agent_prompts["market_opportunity_analyzer"]
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}"}
-                ]
-            )
-            
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                market_analysis = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Market Opportunity Analyzer", "Complete")
-                    
-                return {"market_opportunity": market_analysis}
-            except Exception as e:
-                logger.error(f"Error parsing Market Opportunity Analyzer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Market Opportunity Analyzer", "Error")
-                return {"market_opportunity": {"error": str(e), "raw_response": content}}
+        Args:
+            anthropic_api_key: API key for Anthropic
+            model: Model to use for planning
+            visualizer: Visualizer instance for displaying progress
+            execution_mode: "sync" issues individual API calls; "batch"
+                submits the concurrent stages as one Message Batches
+                request at the discounted batch rate
+            fast_mode: collapse the whole panel into one extended-thinking
+                call that returns only the synthesized strategy
+        """
+        self.anthropic_api_key = anthropic_api_key
+        self.model = model
+        self.visualizer = visualizer
+        self.execution_mode = execution_mode
+        self.fast_mode = fast_mode
         
-        # Customer Insight Specialist node
-        def customer_insight_specialist(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Customer Insight Specialist", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            
-            prompt = self.agent_prompts["customer_insight_specialist"]
+        # Agent prompts live as module-level constants; instances share
+        # the one frozen table
+        self.agent_prompts = _AGENT_PROMPTS
+        
+        # The graph is compiled lazily on first use so constructing a
+        # panel stays cheap for callers that never dispatch to it
+        self._graph = None
+        
+    @property
+    def client(self):
+        """The AsyncAnthropic client for the running event loop.
+        
+        Resolved per call rather than in __init__ because the shared
+        pool is keyed on the running loop: each run() drives its own
+        asyncio.run, and sockets cannot outlive the loop that opened
+        them.
+        """
+        return get_async_client(self.anthropic_api_key)
+        
+    @property
+    def graph(self):
+        """The compiled LangGraph workflow, built on first access."""
+        if self._graph is None:
+            self._graph = self._build_graph()
+        return self._graph
+        
+    async def _cached_create(self, agent_name: str, user_content: str, max_tokens: int = 2000) -> Dict[str, Any]:
+        """Call the model for an agent, memoizing parsed responses on disk.
+        
+        The key is an exact SHA-256 over the agent, model, system prompt,
+        and user content; identical inputs short-circuit to a disk read
+        instead of a multi-second LLM call.
+        
+        Args:
+            agent_name: Agent whose prompt and cache namespace to use
+            user_content: User message content
+            max_tokens: Output-token budget for the call
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"Query: {query}\n\nContext: {json.dumps(context)}\n\nMarket Analysis: {json.dumps(market_analysis)}"}
-                ]
-            )
+        Returns:
+            The parsed response, or an error dict on parse failure
+        """
+        key = hashlib.sha256(
+            f"{agent_name}|{self.model}|{self.agent_prompts[agent_name]}|{user_content}".encode()
+        ).hexdigest()
+        
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            logger.info("Disk cache hit for %s", agent_name)
+            return cached
+        
+        # Stream the response so visualizer progress overlaps with the
+        # network transfer instead of blocking until the full payload lands
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            system=_AGENT_SYSTEMS[agent_name],
+            messages=[
+                {"role": "user", "content": user_content}
+            ],
+            tools=[_submit_tool(agent_name)],
+            tool_choice={"type": "tool", "name": "submit_analysis"}
+        ) as response_stream:
+            received = 0
+            next_update = 2000
+            async for event in response_stream:
+                delta = getattr(event, "delta", None)
+                if delta is None:
+                    continue
+                received += len(getattr(delta, "partial_json", "") or getattr(delta, "text", "") or "")
+                if self.visualizer and received >= next_update:
+                    self.visualizer.update_agent_status(agent_name, f"streaming ({received} chars)")
+                    next_update += 2000
+            response = await response_stream.get_final_message()
+        
+        result = _tool_input(response)
+        if result is None:
+            logger.error("No structured output in %s response", agent_name)
+            return {"error": "No structured output in response"}
+        
+        result = _check_shape(agent_name, result)
+        _RESPONSE_CACHE.set(key, result)
+        return result
+        
+    def _make_node(self, agent_name: str):
+        """Build the graph node function for an agent.
+        
+        The eight hand-written node closures differed only in display
+        name, inputs, and output key, so one factory driven by the
+        module-level agent tables replaces them all; display name, output
+        key, and input list are resolved once at graph-build time and
+        captured in the closure instead of being looked up per call.
+        
+        Args:
+            agent_name: Key into the module-level agent tables
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                customer_insights = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Customer Insight Specialist", "Complete")
-                    
-                return {"customer_insights": customer_insights}
-            except Exception as e:
-                logger.error(f"Error parsing Customer Insight Specialist response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Customer Insight Specialist", "Error")
-                return {"customer_insights": {"error": str(e), "raw_response": content}}
+        Returns:
+            An async node function for the graph
+        """
+        display_name = AGENT_DISPLAY_NAMES[agent_name]
+        state_key = AGENT_STATE_KEYS[agent_name]
+        input_keys = AGENT_INPUT_KEYS[agent_name]
+        is_synthesizer = agent_name == "product_strategy_synthesizer"
         
-        # Product Positioning Strategist node
-        def product_positioning_strategist(state):
+        async def node(state):
             if self.visualizer:
-                self.visualizer.update_agent_status("Product Positioning Strategist", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            customer_insights = state["customer_insights"]
+                self.visualizer.update_agent_status(display_name, "processing")
             
-            prompt = self.agent_prompts["product_positioning_strategist"]
+            sections = [f"Query: {state['query']}"]
+            for input_key in input_keys:
+                # Mid-chain stages read the compact digest of each
+                # upstream output; the synthesizer alone gets full JSON
+                if is_synthesizer or input_key == "context":
+                    blob = state[f"{input_key}_json"]
+                else:
+                    blob = state[f"{input_key}_brief"]
+                sections.append(f"{STATE_LABELS[input_key]}: {blob}")
+            user_content = "\n\n".join(sections)
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Customer Insights: {json.dumps(customer_insights)}
-                    """}
-                ]
+            result = await self._cached_create(
+                agent_name, user_content, max_tokens=3000 if is_synthesizer else 2000
             )
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                product_positioning = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Positioning Strategist", "Complete")
-                    
-                return {"product_positioning": product_positioning}
-            except Exception as e:
-                logger.error(f"Error parsing Product Positioning Strategist response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Positioning Strategist", "Error")
-                return {"product_positioning": {"error": str(e), "raw_response": content}}
-        
-        # Technical Feasibility Evaluator node
-        def technical_feasibility_evaluator(state):
             if self.visualizer:
-                self.visualizer.update_agent_status("Technical Feasibility Evaluator", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            customer_insights = state["customer_insights"]
-            product_positioning = state["product_positioning"]
+                status = "Error" if "error" in result else "Complete"
+                self.visualizer.update_agent_status(display_name, status)
             
-            prompt = self.agent_prompts["technical_feasibility_evaluator"]
-            
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Customer Insights: {json.dumps(customer_insights)}
-                    
-                    Product Positioning: {json.dumps(product_positioning)}
-                    """}
-                ]
-            )
-            
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                technical_feasibility = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Technical Feasibility Evaluator", "Complete")
-                    
-                return {"technical_feasibility": technical_feasibility}
-            except Exception as e:
-                logger.error(f"Error parsing Technical Feasibility Evaluator response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Technical Feasibility Evaluator", "Error")
-                return {"technical_feasibility": {"error": str(e), "raw_response": content}}
+            updates = {state_key: result}
+            if not is_synthesizer:
+                # Serialize once here so downstream consumers read the string
+                updates[f"{state_key}_json"] = fast_dumps(result)
+                updates[f"{state_key}_brief"] = _brief(result)
+            return updates
         
-        # Competitive Landscape Mapper node
-        def competitive_landscape_mapper(state):
+        return node
+        
+    def _build_graph(self) -> "StateGraph":
+        """Build the LangGraph workflow for the Product Development Panel."""
+        from langgraph.graph import StateGraph, END
+        
+        # Create the graph over the module-level state schema
+        graph = StateGraph(ProductDevState)
+        
+        # Fast mode: one extended-thinking call stands in for the whole
+        # eight-stage pipeline, trading inspectable intermediates for a
+        # single round trip
+        async def fast_mode_synthesizer(state):
             if self.visualizer:
-                self.visualizer.update_agent_status("Competitive Landscape Mapper", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            product_positioning = state["product_positioning"]
+                self.visualizer.update_agent_status("Product Strategy Synthesizer", "processing")
             
-            prompt = self.agent_prompts["competitive_landscape_mapper"]
+            query = state["query"]
+            context_json = state["context_json"]
             
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
+                max_tokens=12000,
+                system=_FAST_MODE_SYSTEM,
                 messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Product Positioning: {json.dumps(product_positioning)}
-                    """}
-                ]
+                    {"role": "user", "content": f"Query: {query}\n\nContext: {context_json}"}
+                ],
+                tools=[_submit_tool("product_strategy_synthesizer")],
+                # Forced tool choice is incompatible with extended thinking,
+                # so the prompt instructs the single tool call instead
+                tool_choice={"type": "auto"},
+                thinking={"type": "enabled", "budget_tokens": 8000}
             )
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                competitive_landscape = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Competitive Landscape Mapper", "Complete")
-                    
-                return {"competitive_landscape": competitive_landscape}
-            except Exception as e:
-                logger.error(f"Error parsing Competitive Landscape Mapper response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Competitive Landscape Mapper", "Error")
-                return {"competitive_landscape": {"error": str(e), "raw_response": content}}
-        
-        # Product Roadmap Developer node
-        def product_roadmap_developer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Product Roadmap Developer", "processing")
-                
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            customer_insights = state["customer_insights"]
-            product_positioning = state["product_positioning"]
-            technical_feasibility = state["technical_feasibility"]
-            competitive_landscape = state["competitive_landscape"]
-            
-            prompt = self.agent_prompts["product_roadmap_developer"]
+            result = _tool_input(response)
+            if result is None:
+                logger.error("No structured output in fast-mode response")
+                result = {"error": "No structured output in response"}
+            else:
+                result = _check_shape("product_strategy_synthesizer", result)
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Customer Insights: {json.dumps(customer_insights)}
-                    
-                    Product Positioning: {json.dumps(product_positioning)}
-                    
-                    Technical Feasibility: {json.dumps(technical_feasibility)}
-                    
-                    Competitive Landscape: {json.dumps(competitive_landscape)}
-                    """}
-                ]
-            )
+            if self.visualizer:
+                status = "Error" if "error" in result else "Complete"
+                self.visualizer.update_agent_status("Product Strategy Synthesizer", status)
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                product_roadmap = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Roadmap Developer", "Complete")
-                    
-                return {"product_roadmap": product_roadmap}
-            except Exception as e:
-                logger.error(f"Error parsing Product Roadmap Developer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Roadmap Developer", "Error")
-                return {"product_roadmap": {"error": str(e), "raw_response": content}}
+            return {"product_strategy": result}
         
-        # Go-to-Market Strategist node
-        def go_to_market_strategist(state):
+        if self.fast_mode:
+            graph.add_node("fast_mode_synthesizer", fast_mode_synthesizer)
+            graph.add_edge("fast_mode_synthesizer", END)
+            graph.set_entry_point("fast_mode_synthesizer")
+            return graph.compile()
+        
+        # The two stages that can run concurrently after the market
+        # analysis; batch mode submits them as one Message Batches
+        # request, which Anthropic prices at 50% of individual calls
+        batch_stage = {
+            agent_name: (AGENT_DISPLAY_NAMES[agent_name], AGENT_STATE_KEYS[agent_name])
+            for agent_name in ("customer_insight_specialist", "competitive_landscape_mapper")
+        }
+        
+        async def parallel_stage_batch(state):
             if self.visualizer:
-                self.visualizer.update_agent_status("Go-to-Market Strategist", "processing")
-                
+                for display_name, _ in batch_stage.values():
+                    self.visualizer.update_agent_status(display_name, "processing")
+            
             query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            customer_insights = state["customer_insights"]
-            product_positioning = state["product_positioning"]
-            competitive_landscape = state["competitive_landscape"]
-            product_roadmap = state["product_roadmap"]
+            context_json = state["context_json"]
+            market_analysis_brief = state["market_opportunity_brief"]
+            product_positioning_brief = state.get("product_positioning_brief") or "{}"
             
-            prompt = self.agent_prompts["go_to_market_strategist"]
+            contents = {
+                "customer_insight_specialist": f"Query: {query}\n\nContext: {context_json}\n\nMarket Analysis: {market_analysis_brief}",
+                "competitive_landscape_mapper": f"Query: {query}\n\nContext: {context_json}\n\nMarket Analysis: {market_analysis_brief}\n\nProduct Positioning: {product_positioning_brief}"
+            }
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Customer Insights: {json.dumps(customer_insights)}
-                    
-                    Product Positioning: {json.dumps(product_positioning)}
-                    
-                    Competitive Landscape: {json.dumps(competitive_landscape)}
-                    
-                    Product Roadmap: {json.dumps(product_roadmap)}
-                    """}
+            batch = await self.client.messages.batches.create(
+                requests=[
+                    {
+                        "custom_id": agent_name,
+                        "params": {
+                            "model": self.model,
+                            "max_tokens": 2000,
+                            "temperature": 0.7,
+                            "system": _AGENT_SYSTEMS[agent_name],
+                            "messages": [
+                                {"role": "user", "content": contents[agent_name]}
+                            ],
+                            "tools": [_submit_tool(agent_name)],
+                            "tool_choice": {"type": "tool", "name": "submit_analysis"}
+                        }
+                    }
+                    for agent_name in batch_stage
                 ]
             )
             
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
+            # Poll until the batch finishes processing
+            while batch.processing_status != "ended":
+                await asyncio.sleep(5)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+            
+            updates = {}
+            async for entry in await self.client.messages.batches.results(batch.id):
+                display_name, state_key = batch_stage[entry.custom_id]
                 
-                go_to_market = json.loads(json_str)
+                if entry.result.type != "succeeded":
+                    logger.error("Batch request for %s %s", entry.custom_id, entry.result.type)
+                    if self.visualizer:
+                        self.visualizer.update_agent_status(display_name, "Error")
+                    updates[state_key] = {"error": f"Batch request {entry.result.type}"}
+                    continue
                 
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Go-to-Market Strategist", "Complete")
-                    
-                return {"go_to_market": go_to_market}
-            except Exception as e:
-                logger.error(f"Error parsing Go-to-Market Strategist response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Go-to-Market Strategist", "Error")
-                return {"go_to_market": {"error": str(e), "raw_response": content}}
-        
-        # Product Strategy Synthesizer node
-        def product_strategy_synthesizer(state):
-            if self.visualizer:
-                self.visualizer.update_agent_status("Product Strategy Synthesizer", "processing")
+                result = _tool_input(entry.result.message)
+                if result is None:
+                    logger.error("No structured output in %s batch response", entry.custom_id)
+                    if self.visualizer:
+                        self.visualizer.update_agent_status(display_name, "Error")
+                    updates[state_key] = {"error": "No structured output in response"}
+                    continue
                 
-            query = state["query"]
-            context = state["context"]
-            market_analysis = state["market_opportunity"]
-            customer_insights = state["customer_insights"]
-            product_positioning = state["product_positioning"]
-            technical_feasibility = state["technical_feasibility"]
-            competitive_landscape = state["competitive_landscape"]
-            product_roadmap = state["product_roadmap"]
-            go_to_market = state["go_to_market"]
+                updates[state_key] = _check_shape(entry.custom_id, result)
+                if self.visualizer:
+                    self.visualizer.update_agent_status(display_name, "Complete")
             
-            prompt = self.agent_prompts["product_strategy_synthesizer"]
+            # Mirror each result with its serialized form and digest for
+            # downstream reuse
+            for _, state_key in batch_stage.values():
+                if state_key in updates:
+                    updates[f"{state_key}_json"] = fast_dumps(updates[state_key])
+                    updates[f"{state_key}_brief"] = _brief(updates[state_key])
             
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                temperature=0.7,
-                system=prompt,
-                messages=[
-                    {"role": "user", "content": f"""
-                    Query: {query}
-                    
-                    Context: {json.dumps(context)}
-                    
-                    Market Analysis: {json.dumps(market_analysis)}
-                    
-                    Customer Insights: {json.dumps(customer_insights)}
-                    
-                    Product Positioning: {json.dumps(product_positioning)}
-                    
-                    Technical Feasibility: {json.dumps(technical_feasibility)}
-                    
-                    Competitive Landscape: {json.dumps(competitive_landscape)}
-                    
-                    Product Roadmap: {json.dumps(product_roadmap)}
-                    
-                    Go-to-Market Strategy: {json.dumps(go_to_market)}
-                    """}
-                ]
-            )
-            
-            try:
-                content = response.content[0].text
-                # Extract JSON from the response
-                import re
-                json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                else:
-                    json_str = content
-                
-                product_strategy = json.loads(json_str)
-                
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Strategy Synthesizer", "Complete")
-                    
-                return {"product_strategy": product_strategy}
-            except Exception as e:
-                logger.error(f"Error parsing Product Strategy Synthesizer response: {e}")
-                if self.visualizer:
-                    self.visualizer.update_agent_status("Product Strategy Synthesizer", "Error")
-                return {"product_strategy": {"error": str(e), "raw_response": content}}
+            return updates
+        
+        # Add nodes to the graph, all built from the shared factory
+        graph.add_node("market_opportunity_analyzer", self._make_node("market_opportunity_analyzer"))
+        graph.add_node("product_positioning_strategist", self._make_node("product_positioning_strategist"))
+        graph.add_node("technical_feasibility_evaluator", self._make_node("technical_feasibility_evaluator"))
+        graph.add_node("product_roadmap_developer", self._make_node("product_roadmap_developer"))
+        graph.add_node("go_to_market_strategist", self._make_node("go_to_market_strategist"))
+        graph.add_node("product_strategy_synthesizer", self._make_node("product_strategy_synthesizer"))
         
-        # Add nodes to the graph
-        graph.add_node("market_opportunity_analyzer", market_opportunity_analyzer)
-        graph.add_node("customer_insight_specialist", customer_insight_specialist)
-        graph.add_node("product_positioning_strategist", product_positioning_strategist)
-        graph.add_node("technical_feasibility_evaluator", technical_feasibility_evaluator)
-        graph.add_node("competitive_landscape_mapper", competitive_landscape_mapper)
-        graph.add_node("product_roadmap_developer", product_roadmap_developer)
-        graph.add_node("go_to_market_strategist", go_to_market_strategist)
-        graph.add_node("product_strategy_synthesizer", product_strategy_synthesizer)
+        # Define the edges; batch mode funnels the two concurrent stages
+        # through a single Message Batches node
+        if self.execution_mode == "batch":
+            graph.add_node("parallel_stage_batch", parallel_stage_batch)
+            graph.add_edge("market_opportunity_analyzer", "parallel_stage_batch")
+            graph.add_edge("parallel_stage_batch", "product_positioning_strategist")
+        else:
+            graph.add_node("customer_insight_specialist", self._make_node("customer_insight_specialist"))
+            graph.add_node("competitive_landscape_mapper", self._make_node("competitive_landscape_mapper"))
+            graph.add_edge("market_opportunity_analyzer", "customer_insight_specialist")
+            graph.add_edge("market_opportunity_analyzer", "competitive_landscape_mapper")
+            graph.add_edge("customer_insight_specialist", "product_positioning_strategist")
+            graph.add_edge("competitive_landscape_mapper", "product_roadmap_developer")
         
-        # Define the edges
-        graph.add_edge("market_opportunity_analyzer", "customer_insight_specialist")
-        graph.add_edge("market_opportunity_analyzer", "competitive_landscape_mapper")
-        graph.add_edge("customer_insight_specialist", "product_positioning_strategist")
         graph.add_edge("product_positioning_strategist", "technical_feasibility_evaluator")
-        graph.add_edge("competitive_landscape_mapper", "product_roadmap_developer")
         graph.add_edge("technical_feasibility_evaluator", "product_roadmap_developer")
         graph.add_edge("product_roadmap_developer", "go_to_market_strategist")
         graph.add_edge("go_to_market_strategist", "product_strategy_synthesizer")
@@ -1111,7 +1156,7 @@ class ProductDevelopmentPanel(BasePanel):
         # Parse context if it's a string
         if isinstance(context, str):
             try:
-                context_dict = json.loads(context)
+                context_dict = fast_loads(context)
             except:
                 context_dict = {"raw_context": context}
         else:
@@ -1121,19 +1166,35 @@ class ProductDevelopmentPanel(BasePanel):
         initial_state = {
             "query": query,
             "context": context_dict,
+            "context_json": fast_dumps(context_dict),
             "market_opportunity": {},
+            "market_opportunity_json": "{}",
+            "market_opportunity_brief": "{}",
             "customer_insights": {},
+            "customer_insights_json": "{}",
+            "customer_insights_brief": "{}",
             "product_positioning": {},
+            "product_positioning_json": "{}",
+            "product_positioning_brief": "{}",
             "technical_feasibility": {},
+            "technical_feasibility_json": "{}",
+            "technical_feasibility_brief": "{}",
             "product_roadmap": {},
+            "product_roadmap_json": "{}",
+            "product_roadmap_brief": "{}",
             "go_to_market": {},
+            "go_to_market_json": "{}",
+            "go_to_market_brief": "{}",
             "product_strategy": {},
-            "competitive_landscape": {}
+            "competitive_landscape": {},
+            "competitive_landscape_json": "{}",
+            "competitive_landscape_brief": "{}"
         }
         
-        # Run the graph
+        # Run the graph; async nodes let the customer-insight chain and the
+        # competitive-landscape branch actually execute concurrently
         try:
-            result = self.graph.invoke(initial_state)
+            result = asyncio.run(self.graph.ainvoke(initial_state))
             
             if self.visualizer:
                 self.visualizer.display_success("Product Development Panel completed successfully")
@@ -1141,7 +1202,7 @@ class ProductDevelopmentPanel(BasePanel):
             
             return result["product_strategy"]
         except Exception as e:
-            logger.error(f"Error running Product Development Panel: {e}")
+            logger.error("Error running Product Development Panel: %s", e)
             if self.visualizer:
                 self.visualizer.display_error(f"Error running Product Development Panel: {e}")
             return {
@@ -25,13 +25,17 @@ package_data = {
 prompts = glob('prompts/*.md')
 
 # Define LLM provider dependencies separately for better organization
-anthropic_deps = ["anthropic>=0.8.0"]
+anthropic_deps = ["anthropic>=0.49,<1.0"]
 openai_deps = ["openai>=1.3.0", "langchain-openai>=0.1.0"]
 perplexity_deps = ["PerplexiPy>=1.0.0"]
 
 # All LLM providers together
 all_llm_deps = anthropic_deps + openai_deps + perplexity_deps
 
+# Optional accelerators: core/json_utils.py falls back to stdlib json
+# when orjson is absent
+fast_deps = ["orjson>=3.8.0"]
+
 # Development dependencies
 dev_deps = [
     "pytest>=7.0.0",
@@ -62,7 +66,7 @@ setup(
         "colorama>=0.4.4",
         "markdown>=3.3.0",
         "tiktoken>=0.4.0",
-        "tenacity>=8.0.0",
+        "tenacity>=8.1.0",
         "regex>=2022.1.18",
         "questionary>=2.0.0",
         
@@ -72,7 +76,7 @@ setup(
         "langgraph-swarm>=0.0.7",
         
         # Default LLM provider - Anthropic is included by default
-        "anthropic>=0.8.0",
+        "anthropic>=0.49,<1.0",
     ],
     extras_require={
         # Optional LLM providers - can be installed separately
@@ -82,8 +86,11 @@ setup(
         # Install all LLM providers at once
         "all": all_llm_deps,
         
+        # Optional performance extras (fast JSON serialization)
+        "fast": fast_deps,
+        
         # Complete installation with all providers and development tools
-        "complete": all_llm_deps + dev_deps,
+        "complete": all_llm_deps + fast_deps + dev_deps,
         
         # Development dependencies only
         "dev": dev_deps,